@@ -1512,20 +1512,18 @@ def _persist_mcp_servers(project_path: Path, mcp_servers: dict[str, Any]) -> Non
 
 def _persist_categories(project_path: Path, categories: dict[str, dict[str, str]]) -> None:
     """Persist custom artifact categories into config.yml's ``categories`` section."""
+    from ruamel.yaml import CommentedMap
+
     from osprey.utils.config_writer import _load, _save
 
     config_path = project_path / "config.yml"
     data = _load(config_path)
 
     if "categories" not in data:
-        from ruamel.yaml import CommentedMap
-
         data["categories"] = CommentedMap()
     cat_section = data["categories"]
 
     for key, spec in categories.items():
-        from ruamel.yaml import CommentedMap
-
         entry = CommentedMap()
         entry["label"] = spec["label"]
         entry["color"] = spec["color"]
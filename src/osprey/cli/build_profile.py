@@ -10,7 +10,7 @@ from __future__ import annotations
 import importlib.resources
 import re
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Literal
 
@@ -101,6 +101,10 @@ class DispatchConfig:
     pv_strip_prefix: str = ""
 
 
+# Recognized dispatch keys; the dataclass is the single source of field
+# defaults so the loader can't drift from it when a field is added.
+_DISPATCH_FIELD_NAMES = frozenset(f.name for f in fields(DispatchConfig))
+
 _ENV_VAR_RE = re.compile(r"^[A-Z_][A-Z0-9_]*$")
 
 
@@ -644,15 +648,11 @@ def _parse_profile(raw: dict[str, Any]) -> BuildProfile:
             raise BuildProfileError("Profile 'dispatch' must be a mapping")
         dispatch = DispatchConfig(
             triggers=dispatch_raw.get("triggers", ""),
-            worker_count=dispatch_raw.get("worker_count", 1),
-            workspace_mode=dispatch_raw.get("workspace_mode", "isolated"),
-            max_concurrent_runs=dispatch_raw.get("max_concurrent_runs", 2),
-            max_queue_depth=dispatch_raw.get("max_queue_depth", 50),
-            dispatcher_port=dispatch_raw.get("dispatcher_port", 8020),
-            worker_port_base=dispatch_raw.get("worker_port_base", 9190),
-            timeout_sec=dispatch_raw.get("timeout_sec", 300),
-            facility_name=dispatch_raw.get("facility_name", ""),
-            pv_strip_prefix=dispatch_raw.get("pv_strip_prefix", ""),
+            **{
+                k: v
+                for k, v in dispatch_raw.items()
+                if k != "triggers" and k in _DISPATCH_FIELD_NAMES
+            },
         )
 
     return BuildProfile(
@@ -617,21 +617,26 @@ def benchmark(
         style=Styles.INFO,
     )
 
-    try:
-        all_runs = []
+    # One event loop for the whole benchmark: per-run asyncio.run() would
+    # create and tear down a loop (and any loop-bound client state) for
+    # every repetition.
+    async def _run_all() -> list:
+        runs = []
         for run_idx in range(runs_per_query):
             if runs_per_query > 1:
                 console.print(
                     f"\n--- Run {run_idx + 1}/{runs_per_query} ---",
                     style=Styles.INFO,
                 )
-            run = asyncio.run(
-                runner.run_queries(
-                    query_indices=indices if queries != "all" else None,
-                    output_dir=out_directory,
-                )
+            run = await runner.run_queries(
+                query_indices=indices if queries != "all" else None,
+                output_dir=out_directory,
             )
-            all_runs.append(run)
+            runs.append(run)
+        return runs
+
+    try:
+        all_runs = asyncio.run(_run_all())
 
         # Print summary
         console.print(
@@ -267,6 +267,9 @@ def discover_nearby_projects(max_dirs: int = 50, max_time_ms: int = 100) -> list
 # --- Main Menu ---
 
 
+_project_menu_choices_cache: dict[str, list] = {}
+
+
 def get_project_menu_choices(exit_action: str = "exit") -> list[Choice]:
     """Get standard project menu choices.
 
@@ -280,6 +283,12 @@ def get_project_menu_choices(exit_action: str = "exit") -> list[Choice]:
     Returns:
         List of Choice objects for the project menu
     """
+    # Choices are static per exit_action, so build them once and reuse on
+    # every menu display (lazily — Choice is None when questionary is absent).
+    cached = _project_menu_choices_cache.get(exit_action)
+    if cached is not None:
+        return list(cached)
+
     choices = [
         Choice("[>] deploy      - Manage services (web UIs)", value="deploy"),
         Choice("[>] health      - Run system health check", value="health"),
@@ -294,7 +303,8 @@ def get_project_menu_choices(exit_action: str = "exit") -> list[Choice]:
     else:
         choices.append(Choice("[x] exit        - Exit CLI", value="exit"))
 
-    return choices
+    _project_menu_choices_cache[exit_action] = choices
+    return list(choices)
 
 
 def show_main_menu() -> str | None:
@@ -416,24 +426,33 @@ def check_directory_has_active_mounts(directory: Path) -> tuple[bool, list[str]]
             containers = result.stdout.strip().split("\n")
             containers = [c for c in containers if c]  # Remove empty strings
 
-            for container in containers:
-                # Inspect each container for mounts
+            if containers:
+                # Inspect all containers in one invocation — `inspect` accepts
+                # multiple names and prints one line per container, so this is
+                # a single fork/exec instead of one per container. The name is
+                # carried in the format so lines stay attributable even if a
+                # container vanished between ps and inspect (docker prefixes
+                # names with '/', hence the lstrip).
                 inspect_result = subprocess.run(
-                    [runtime, "inspect", "--format", "{{json .Mounts}}", container],
+                    [runtime, "inspect", "--format", "{{.Name}}|{{json .Mounts}}", *containers],
                     capture_output=True,
                     text=True,
                     timeout=5,
                 )
 
-                if inspect_result.returncode == 0:
+                for line in inspect_result.stdout.strip().split("\n"):
+                    if "|" not in line:
+                        continue
+                    container, mounts_json = line.split("|", 1)
+                    container = container.lstrip("/")
                     try:
-                        mounts = json.loads(inspect_result.stdout)
-                        for mount in mounts:
-                            source = mount.get("Source", "")
-                            if dir_str in source or source.startswith(dir_str):
-                                mount_details.append(f"Container '{container}' has mount: {source}")
+                        mounts = json.loads(mounts_json)
                     except json.JSONDecodeError:
-                        pass
+                        continue
+                    for mount in mounts or []:
+                        source = mount.get("Source", "")
+                        if dir_str in source or source.startswith(dir_str):
+                            mount_details.append(f"Container '{container}' has mount: {source}")
     except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
         # Podman also not available - assume no mounts
         pass
@@ -24,6 +24,15 @@ def render_template(
     template = jinja_env.get_template(template_path)
     rendered = template.render(**context)
 
+    # Skip the write when the rendered output matches what's on disk: a regen
+    # fans out over every artifact, and rewriting unchanged ones just churns
+    # mtimes that the session-start drift check keys off.
+    try:
+        if output_path.read_text(encoding="utf-8") == rendered:
+            return
+    except OSError:
+        pass  # Missing or unreadable — fall through to the write
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
     # Use UTF-8 encoding explicitly to support Unicode characters on Windows
     output_path.write_text(rendered, encoding="utf-8")
@@ -170,11 +170,13 @@ def build_claude_code_context(
         model_spec = None
     ctx["claude_code_model_spec"] = model_spec
 
+    control_system = config.get("control_system", {}) or {}
+
     # Write tools blocked by the writes kill switch (for hook_config.json)
-    ctx["control_system_write_tools"] = config.get("control_system", {}).get("write_tools", [])
+    ctx["control_system_write_tools"] = control_system.get("write_tools", [])
 
     # Control system type for protocol-aware safety rules
-    ctx["control_system_type"] = config.get("control_system", {}).get("type", "mock")
+    ctx["control_system_type"] = control_system.get("type", "mock")
 
     # Kill-switch hard-block: when control-system writes are disabled, render
     # pure-write tools into permissions.deny so Claude Code's permissions layer
@@ -186,7 +188,7 @@ def build_claude_code_context(
     # (it has a legitimate readonly path), so instead it is pulled OUT of
     # permissions.ask — with no static ask entry, the writes_check hook's deny
     # on a readwrite execute stands alone and blocks the call before the prompt.
-    if not config.get("control_system", {}).get("writes_enabled", False):
+    if not control_system.get("writes_enabled", False):
         facility_perms = dict(ctx["facility_permissions"])
         deny = list(facility_perms.get("deny", []))
         if "mcp__controls__channel_write" not in deny:
@@ -478,7 +480,10 @@ def create_claude_code_integration(
                     continue
 
                 dst_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src_file, dst_file)
+                # Skip byte-identical copies for the same reason render_template
+                # skips unchanged renders: don't churn mtimes on a no-op regen.
+                if not dst_file.exists() or dst_file.read_bytes() != src_file.read_bytes():
+                    shutil.copy2(src_file, dst_file)
             files_created += 1
 
     # 4. Set hook scripts executable
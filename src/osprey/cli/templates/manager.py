@@ -15,6 +15,22 @@ from osprey.cli.templates._rendering import render_template as _render_template
 from osprey.errors import BuildProfileError
 from osprey.utils.config import resolve_env_vars
 
+_default_manager: "TemplateManager | None" = None
+
+
+def get_template_manager() -> "TemplateManager":
+    """Return a shared :class:`TemplateManager` instance.
+
+    Long-lived processes (the web terminal regen hooks) should use this
+    instead of constructing a fresh manager per call: a new Jinja
+    ``Environment`` discards its compiled-template cache, so every regen
+    would recompile every template from source.
+    """
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = TemplateManager()
+    return _default_manager
+
 
 class TemplateManager:
     """Manages project templates and scaffolding.
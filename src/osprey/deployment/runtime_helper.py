@@ -15,10 +15,23 @@ Examples:
 import os
 import shutil
 import subprocess
+import time
 
 # Module-level cache for runtime command
 _cached_runtime_cmd: list[str] | None = None
 
+# Negative-result cache: (monotonic timestamp, error message) from the last
+# failed detection. Callers that loop (e.g. the interactive menu) would
+# otherwise fork the same failing `compose version`/`ps` probes on every
+# call; re-probe after the window in case a runtime was installed/started.
+_detection_failure: tuple[float, str] | None = None
+_FAILURE_RETRY_SECONDS = 60.0
+
+# Set when detection itself just ran `<runtime> ps` successfully, so the
+# verify step immediately after can skip an identical blocking subprocess.
+# Consumed (reset) on use — later verifications re-check the daemon.
+_detection_verified_daemon: bool = False
+
 
 def get_runtime_command(config: dict | None = None) -> list[str]:
     """Get container compose command.
@@ -35,11 +48,17 @@ def get_runtime_command(config: dict | None = None) -> list[str]:
     Raises:
         RuntimeError: If no container runtime with compose support found
     """
-    global _cached_runtime_cmd
+    global _cached_runtime_cmd, _detection_verified_daemon, _detection_failure
 
     if _cached_runtime_cmd is not None:
         return _cached_runtime_cmd.copy()
 
+    if _detection_failure is not None:
+        failed_at, message = _detection_failure
+        if time.monotonic() - failed_at < _FAILURE_RETRY_SECONDS:
+            raise RuntimeError(message)
+        _detection_failure = None
+
     # Determine which runtime to try (priority: env var > config > auto)
     config_runtime = None
     if config:
@@ -75,6 +94,7 @@ def get_runtime_command(config: dict | None = None) -> list[str]:
 
             if ps_result.returncode == 0:
                 _cached_runtime_cmd = [runtime, "compose"]
+                _detection_verified_daemon = True
                 return _cached_runtime_cmd.copy()
 
         except (subprocess.TimeoutExpired, FileNotFoundError):
@@ -91,14 +111,16 @@ def get_runtime_command(config: dict | None = None) -> list[str]:
             error_parts.append("\n" + _get_docker_not_running_message())
         if podman_installed:
             error_parts.append("\n" + _get_podman_not_running_message())
-        raise RuntimeError("".join(error_parts))
+        message = "".join(error_parts)
     else:
         # No runtime installed at all
-        raise RuntimeError(
+        message = (
             "No container runtime found. Install Docker Desktop 4.0+ or Podman 4.0+\n"
             "Docker: https://docs.docker.com/get-docker/\n"
             "Podman: https://podman.io/getting-started/installation"
         )
+    _detection_failure = (time.monotonic(), message)
+    raise RuntimeError(message)
 
 
 def verify_runtime_is_running(config: dict | None = None) -> tuple[bool, str]:
@@ -112,10 +134,19 @@ def verify_runtime_is_running(config: dict | None = None) -> tuple[bool, str]:
         If running: (True, "")
         If not running: (False, helpful error message)
     """
+    global _detection_verified_daemon
+
     try:
         cmd = get_runtime_command(config)
         runtime = cmd[0]  # 'docker' or 'podman'
 
+        # Fresh detection just proved the daemon is up with its own `ps` call;
+        # skip running an identical blocking subprocess back-to-back. The flag
+        # is consumed so later calls (cached detection) still re-check.
+        if _detection_verified_daemon:
+            _detection_verified_daemon = False
+            return True, ""
+
         # Try a simple ps command to verify daemon is accessible
         result = subprocess.run([runtime, "ps"], capture_output=True, text=True, timeout=5)
 
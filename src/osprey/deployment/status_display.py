@@ -18,6 +18,24 @@ from osprey.utils.logger import get_logger
 logger = get_logger("deployment.status")
 
 
+def _extract_project_label(container):
+    """Return the ``osprey.project.name`` label for a container, or "unknown".
+
+    Handles both label formats the runtimes emit: a dict (Podman JSON) or a
+    comma-separated ``key=value`` string (Docker JSON lines).
+    """
+    labels = container.get("Labels", {})
+    if isinstance(labels, dict):
+        return labels.get("osprey.project.name", "unknown")
+    if isinstance(labels, str):
+        for label in labels.split(","):
+            if "=" in label:
+                key, value = label.split("=", 1)
+                if key.strip() == "osprey.project.name":
+                    return value.strip()
+    return "unknown"
+
+
 class _DefaultStyles:
     """Fallback styles when cli.styles is not available."""
 
@@ -108,24 +126,15 @@ def show_status(config_path, *, console=None, styles=None):
         console.print(f"\n[red]Error: {e}[/red]\n")
         return
 
-    # Separate containers into project and non-project
+    # Separate containers into project and non-project. Each list holds
+    # (container, project_label) pairs so the label parse — the one per-item
+    # read both the partition and the table rendering need — happens exactly
+    # once per container instead of once per consumer.
     project_containers = []
     other_containers = []
 
     for container in all_containers:
-        # Extract project label
-        labels = container.get("Labels", {})
-        container_project = "unknown"
-
-        if isinstance(labels, dict):
-            container_project = labels.get("osprey.project.name", "unknown")
-        elif isinstance(labels, str):
-            for label in labels.split(","):
-                if "=" in label:
-                    key, value = label.split("=", 1)
-                    if key.strip() == "osprey.project.name":
-                        container_project = value.strip()
-                        break
+        container_project = _extract_project_label(container)
 
         # Check if container belongs to this project
         belongs_to_project = container_project == current_project
@@ -142,11 +151,11 @@ def show_status(config_path, *, console=None, styles=None):
         )
 
         if belongs_to_project or matches_service:
-            project_containers.append(container)
+            project_containers.append((container, container_project))
         else:
             # Only include containers with osprey labels in "other"
             if container_project != "unknown":
-                other_containers.append(container)
+                other_containers.append((container, container_project))
 
     # Helper functions for status display
     def _create_status_table():
@@ -159,7 +168,7 @@ def show_status(config_path, *, console=None, styles=None):
         table.add_column("Image", style=styles.DIM)
         return table
 
-    def _add_container_to_table(table, container):
+    def _add_container_to_table(table, container, project_name):
         """Add a container as a row in the status table."""
         # Extract container name
         names = container.get("Names", [])
@@ -168,19 +177,6 @@ def show_status(config_path, *, console=None, styles=None):
         else:
             container_name = str(names) if names else "unknown"
 
-        # Extract project label
-        labels = container.get("Labels", {})
-        project_name = "unknown"
-        if isinstance(labels, dict):
-            project_name = labels.get("osprey.project.name", "unknown")
-        elif isinstance(labels, str):
-            for label in labels.split(","):
-                if "=" in label:
-                    key, value = label.split("=", 1)
-                    if key.strip() == "osprey.project.name":
-                        project_name = value.strip()
-                        break
-
         # Truncate long project names
         if len(project_name) > 12:
             project_name = project_name[:9] + "..."
@@ -231,8 +227,8 @@ def show_status(config_path, *, console=None, styles=None):
 
     if project_containers:
         table = _create_status_table()
-        for container in project_containers:
-            _add_container_to_table(table, container)
+        for container, project_name in project_containers:
+            _add_container_to_table(table, container, project_name)
         console.print(table)
     else:
         console.print(
@@ -247,8 +243,8 @@ def show_status(config_path, *, console=None, styles=None):
     if other_containers:
         console.print("\n[bold]Other Osprey Containers:[/bold]")
         other_table = _create_status_table()
-        for container in other_containers:
-            _add_container_to_table(other_table, container)
+        for container, project_name in other_containers:
+            _add_container_to_table(other_table, container, project_name)
         console.print(other_table)
 
     console.print()
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
 
 _DASHBOARD_HTML = Path(__file__).parent / "dashboard.html"
 
 
+@functools.lru_cache(maxsize=1)
 def render_dashboard_html(facility_name: str = "", pv_strip_prefix: str = "") -> str:
     """Read dashboard.html and inject runtime config via the OSPREY_CONFIG_PLACEHOLDER sentinel.
 
@@ -21,6 +23,10 @@ def render_dashboard_html(facility_name: str = "", pv_strip_prefix: str = "") ->
 
     Returns:
         The dashboard HTML with the runtime config injected where the sentinel is present.
+
+    The result is memoized: the HTML on disk and the injected config are both
+    fixed for the life of the process, so each page load shouldn't re-read and
+    re-splice the file.
     """
     html = _DASHBOARD_HTML.read_text()
     config = json.dumps({"facility_name": facility_name, "pv_strip_prefix": pv_strip_prefix})
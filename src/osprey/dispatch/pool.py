@@ -8,6 +8,12 @@ from typing import Any
 
 logger = logging.getLogger("osprey.dispatch.pool")
 
+# Retain at most this many finished dispatch results. A long-lived dispatcher
+# accumulates one _results entry per dispatch forever otherwise; 1000 matches
+# the per-trigger history cap in the registry. In-flight entries never count
+# against (or get evicted by) the cap.
+_RESULTS_MAX = 1000
+
 
 class QueueFullError(Exception):
     """Raised when the dispatch queue exceeds max_queue_depth."""
@@ -24,6 +30,11 @@ class DispatchPool:
         self._inflight = 0
         self._running = 0
         self._results: dict[str, dict[str, Any]] = {}
+        # Reverse index: worker run_id → {trigger_name, dispatch_id}. Kept
+        # up to date as dispatches complete so dashboard pollers can enrich
+        # worker runs with a dict lookup instead of rescanning _results on
+        # every poll.
+        self._run_index: dict[str, dict[str, Any]] = {}
 
     async def submit(self, trigger_name: str, dispatch_fn: Callable) -> str:
         """Submit a dispatch function for execution.
@@ -55,18 +66,22 @@ class DispatchPool:
         self._running += 1
         try:
             result = await dispatch_fn()
-            self._results[dispatch_id] = {
-                "status": "completed",
-                "result": result,
-                "trigger_name": trigger_name,
-            }
+            self._store_result(
+                dispatch_id,
+                {"status": "completed", "result": result, "trigger_name": trigger_name},
+            )
+            run_id = result.get("run_id") if isinstance(result, dict) else None
+            if run_id:
+                self._run_index[run_id] = {
+                    "trigger_name": trigger_name,
+                    "dispatch_id": dispatch_id,
+                }
         except Exception as exc:
             logger.error("Dispatch %s failed: %s", dispatch_id, exc)
-            self._results[dispatch_id] = {
-                "status": "error",
-                "error": str(exc),
-                "trigger_name": trigger_name,
-            }
+            self._store_result(
+                dispatch_id,
+                {"status": "error", "error": str(exc), "trigger_name": trigger_name},
+            )
         finally:
             self._running -= 1
             self._inflight -= 1
@@ -82,6 +97,32 @@ class DispatchPool:
         self._inflight += 1
         asyncio.create_task(self._run(dispatch_id, trigger_name, dispatch_fn))
 
+    def _store_result(self, dispatch_id: str, entry: dict[str, Any]) -> None:
+        """Record a terminal result, evicting the oldest finished ones past the cap.
+
+        Re-inserting moves the entry to the end of the dict, so iteration
+        order is oldest-finished-first among terminal entries and eviction
+        skips the (bounded) set of still-pending ones.
+        """
+        self._results.pop(dispatch_id, None)
+        self._results[dispatch_id] = entry
+        while len(self._results) > _RESULTS_MAX:
+            oldest = next(
+                (did for did, res in self._results.items() if res.get("status") != "pending"),
+                None,
+            )
+            if oldest is None:
+                break
+            evicted = self._results.pop(oldest)
+            result = evicted.get("result")
+            run_id = result.get("run_id") if isinstance(result, dict) else None
+            if run_id:
+                self._run_index.pop(run_id, None)
+
+    def run_enrichment(self, run_id: str) -> dict[str, Any]:
+        """Return {trigger_name, dispatch_id} for a worker run_id, or {}."""
+        return self._run_index.get(run_id, {})
+
     def get_result(self, dispatch_id: str) -> dict[str, Any] | None:
         """Return the result for a dispatch_id, or None if unknown."""
         return self._results.get(dispatch_id)
@@ -21,6 +21,9 @@ class TriggerRegistry:
         self._triggers: dict[str, TriggerConfig] = {}
         self._status: dict[str, str] = {}
         self._last_fired: dict[str, str | None] = {}
+        # History entries are (epoch_seconds, event_dict) tuples: the float
+        # lets the since_seconds window filter compare numbers instead of
+        # parsing each entry's ISO timestamp back into a datetime per call.
         self._history: dict[str, deque] = {}
 
     async def register(self, trigger: TriggerConfig) -> None:
@@ -77,7 +80,8 @@ class TriggerRegistry:
         async with self._lock:
             if name not in self._triggers:
                 raise KeyError(f"Trigger '{name}' not registered")
-            ts = datetime.now(tz=UTC).isoformat()
+            now_dt = datetime.now(tz=UTC)
+            ts = now_dt.isoformat()
             self._last_fired[name] = ts
 
             try:
@@ -92,7 +96,7 @@ class TriggerRegistry:
                 }
 
             self._history[name].append(
-                {"timestamp": ts, "event_data": event_data, "result": result}
+                (now_dt.timestamp(), {"timestamp": ts, "event_data": event_data, "result": result})
             )
 
     async def get_history(
@@ -109,16 +113,44 @@ class TriggerRegistry:
         async with self._lock:
             if name not in self._triggers:
                 raise KeyError(f"Trigger '{name}' not registered")
-            entries = list(self._history[name])
-            if since_seconds is not None:
-                cutoff = datetime.now(tz=UTC).timestamp() - since_seconds
-                filtered = []
-                for entry in entries:
-                    try:
-                        entry_ts = datetime.fromisoformat(entry["timestamp"]).timestamp()
-                    except (KeyError, ValueError):
-                        continue
-                    if entry_ts >= cutoff:
-                        filtered.append(entry)
-                entries = filtered
-            return entries[-limit:] if limit > 0 else entries
+            return self._history_slice(name, limit, since_seconds)
+
+    async def get_all_history(
+        self,
+        limit: int = 50,
+        since_seconds: float | None = None,
+    ) -> dict[str, list[dict]]:
+        """Return filtered history for every registered trigger, keyed by name.
+
+        Equivalent to calling :meth:`get_history` per trigger, but takes the
+        lock once — the dashboard polls history for all triggers on every
+        refresh, and per-trigger calls cost a lock round-trip each.
+        """
+        async with self._lock:
+            return {
+                name: self._history_slice(name, limit, since_seconds) for name in self._triggers
+            }
+
+    def _history_slice(
+        self,
+        name: str,
+        limit: int,
+        since_seconds: float | None,
+    ) -> list[dict]:
+        """Filtered copy of one trigger's history. Caller must hold the lock."""
+        stored = list(self._history[name])
+        if since_seconds is not None:
+            cutoff = datetime.now(tz=UTC).timestamp() - since_seconds
+            # record_event appends in chronological order with timestamps
+            # it generated itself, so scan from the newest entry and stop
+            # at the first one past the cutoff — a float comparison per
+            # entry, no timestamp parsing.
+            kept: list[tuple[float, dict]] = []
+            for item in reversed(stored):
+                if item[0] < cutoff:
+                    break
+                kept.append(item)
+            kept.reverse()
+            stored = kept
+        entries = [entry for _, entry in stored]
+        return entries[-limit:] if limit > 0 else entries
@@ -21,6 +21,7 @@ from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import Any
 
+import httpx
 from fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, StreamingResponse
@@ -38,10 +39,12 @@ from osprey.dispatch.trigger_config import (
 from osprey.dispatch.worker_client import (
     AuthError,
     DispatchError,
+    aclose_shared_client,
     cancel_worker_run,
     dispatch_to_worker,
     fetch_worker_runs,
     proxy_worker_stream,
+    set_shared_client,
 )
 
 logger = logging.getLogger("osprey.dispatch.server")
@@ -187,11 +190,16 @@ async def _dispatch_lifespan(_):  # noqa: ANN001, ANN202 - FastMCP passes the ap
     # Start sources (cron tasks, etc.). Webhook routes were already registered at factory time.
     if source_reg is not None and fire_callback is not None:
         await source_reg.start_all(fire_callback)
+    # One connection pool for all worker calls (dispatches, dashboard polls,
+    # cancels) instead of a throwaway client per call. Per-call timeouts are
+    # passed per request, so the pool-wide timeout stays unset.
+    set_shared_client(httpx.AsyncClient(timeout=None))
     try:
         yield
     finally:
         if source_reg is not None:
             await source_reg.stop_all()
+        await aclose_shared_client()
 
 
 mcp = FastMCP(
@@ -391,19 +399,10 @@ def create_server() -> FastMCP:
                 {"detail": "worker unreachable", "worker_error": str(exc)}, status_code=502
             )
 
-        # Build reverse index: run_id → (trigger_name, dispatch_id)
-        reverse: dict[str, dict] = {}
-        for did, res in pool._results.items():
-            if res.get("status") == "completed":
-                rid = (res.get("result") or {}).get("run_id")
-                if rid:
-                    reverse[rid] = {
-                        "trigger_name": res.get("trigger_name"),
-                        "dispatch_id": did,
-                    }
-
+        # Enrich with run_id → (trigger_name, dispatch_id) from the pool's
+        # incrementally maintained index.
         for run in runs:
-            enrichment = reverse.get(run.get("run_id", ""), {})
+            enrichment = pool.run_enrichment(run.get("run_id", ""))
             run["trigger_name"] = enrichment.get("trigger_name")
             run["dispatch_id"] = enrichment.get("dispatch_id")
 
@@ -438,6 +437,12 @@ def create_server() -> FastMCP:
 
         Query params:
             timeline_hours (float, default 24): how far back to include timeline events.
+            include_runs (default 1): pass 0 to skip the worker-runs fetch. Pool,
+                triggers and timeline are in-process reads; runs cost an HTTP
+                round-trip to the dispatch worker, so the dashboard polls them at
+                a slower cadence and reuses its last snapshot in between. ``runs``
+                is null (not []) when skipped so clients can tell "not fetched"
+                from "worker reports none".
         """
         unauth = _check_auth(request)
         if unauth is not None:
@@ -447,6 +452,7 @@ def create_server() -> FastMCP:
         except ValueError:
             timeline_hours = 24.0
         since_seconds = max(0.0, timeline_hours) * 3600.0
+        include_runs = request.query_params.get("include_runs", "1") != "0"
 
         # Triggers (enrich with config detail)
         triggers = await registry.list_triggers()
@@ -459,40 +465,30 @@ def create_server() -> FastMCP:
                 t["source_config"] = _sanitize_source_config(cfg.source_config or {})
 
         # Runs (proxy + enrich with trigger_name)
-        runs: list[dict[str, Any]] = []
+        runs: list[dict[str, Any]] | None = None
         worker_error: str | None = None
-        try:
-            runs = await fetch_worker_runs(dispatch_target, dispatch_token)
-        except DispatchError as exc:
-            # Don't mask a down worker as an empty-but-healthy run list; carry a
-            # marker so the dashboard can show a degraded state.
-            logger.error("dashboard_state: failed to fetch worker runs: %s", exc)
-            worker_error = str(exc)
-
-        reverse: dict[str, dict] = {}
-        for did, res in pool._results.items():
-            rid = None
-            if res.get("status") == "completed" and "result" in res:
-                rid = (res.get("result") or {}).get("run_id")
-            if rid:
-                reverse[rid] = {
-                    "trigger_name": res.get("trigger_name"),
-                    "dispatch_id": did,
-                }
-        for run in runs:
-            enrichment = reverse.get(run.get("run_id", ""), {})
-            run["trigger_name"] = enrichment.get("trigger_name")
-            run["dispatch_id"] = enrichment.get("dispatch_id")
-
-        # Timeline per trigger — from registry history, filtered by time window
+        if include_runs:
+            runs = []
+            try:
+                runs = await fetch_worker_runs(dispatch_target, dispatch_token)
+            except DispatchError as exc:
+                # Don't mask a down worker as an empty-but-healthy run list; carry a
+                # marker so the dashboard can show a degraded state.
+                logger.error("dashboard_state: failed to fetch worker runs: %s", exc)
+                worker_error = str(exc)
+
+            for run in runs:
+                enrichment = pool.run_enrichment(run.get("run_id", ""))
+                run["trigger_name"] = enrichment.get("trigger_name")
+                run["dispatch_id"] = enrichment.get("dispatch_id")
+
+        # Timeline per trigger — from registry history, filtered by time window.
+        # Fetched for all triggers in one call rather than a per-trigger
+        # get_history await (one lock round-trip each) on every poll.
+        all_events = await registry.get_all_history(limit=1000, since_seconds=since_seconds)
         timeline: dict[str, list[dict]] = {}
         for t in triggers:
-            try:
-                events = await registry.get_history(
-                    t["name"], limit=1000, since_seconds=since_seconds
-                )
-            except KeyError:
-                events = []
+            events = all_events.get(t["name"], [])
             compact = []
             for ev in events:
                 result = ev.get("result", "")
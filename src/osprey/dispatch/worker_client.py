@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
 from typing import Any, cast
 
 import httpx
@@ -16,12 +17,34 @@ class AuthError(Exception):
     """Raised when the worker returns HTTP 401 Unauthorized."""
 
 
+# Process-wide client installed by the dispatcher lifespan. When set, worker
+# calls that aren't given an explicit ``client`` reuse its connection pool
+# instead of building and tearing down a throwaway client (and TCP
+# connection) per dispatch or dashboard poll.
+_shared_client: httpx.AsyncClient | None = None
+
+
+def set_shared_client(client: httpx.AsyncClient | None) -> None:
+    """Install (or clear, with None) the shared client for worker calls."""
+    global _shared_client
+    _shared_client = client
+
+
+async def aclose_shared_client() -> None:
+    """Close and clear the shared client, if one is installed."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
 async def dispatch_to_worker(
     url: str,
     prompt: str,
     allowed_tools: list[str],
     token: str,
     timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """POST a prompt to a dispatch worker's /dispatch endpoint.
 
@@ -31,6 +54,8 @@ async def dispatch_to_worker(
         allowed_tools: List of tool names the agent is allowed to use.
         token: Bearer token for authentication.
         timeout: Request timeout in seconds.
+        client: Explicit client to reuse; defaults to the shared client when
+            one is installed, else a throwaway client per call.
 
     Returns:
         Response JSON dict (typically contains ``run_id`` and ``status``).
@@ -43,9 +68,16 @@ async def dispatch_to_worker(
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"prompt": prompt, "allowed_tools": allowed_tools}
 
+    if client is None:
+        client = _shared_client
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(dispatch_url, json=payload, headers=headers)
+        if client is not None:
+            response = await client.post(
+                dispatch_url, json=payload, headers=headers, timeout=timeout
+            )
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as own_client:
+                response = await own_client.post(dispatch_url, json=payload, headers=headers)
     except httpx.TimeoutException as exc:
         raise DispatchError(f"Timeout dispatching to {dispatch_url}: {exc}") from exc
     except httpx.ConnectError as exc:
@@ -67,7 +99,12 @@ async def dispatch_to_worker(
     return cast(dict[str, Any], response.json())
 
 
-async def fetch_worker_runs(url: str, token: str, timeout: float = 10.0) -> list[dict[str, Any]]:
+async def fetch_worker_runs(
+    url: str,
+    token: str,
+    timeout: float = 10.0,
+    client: httpx.AsyncClient | None = None,
+) -> list[dict[str, Any]]:
     """Fetch recent runs from a worker's /dashboard/runs endpoint.
 
     The /dashboard/runs endpoint is bearer-gated like the other worker endpoints,
@@ -77,6 +114,8 @@ async def fetch_worker_runs(url: str, token: str, timeout: float = 10.0) -> list
         url: Base URL of the worker service (e.g. "http://dispatch-worker-1:9190").
         token: Bearer token for the worker (DISPATCH_WORKER_TOKEN).
         timeout: Request timeout in seconds.
+        client: Explicit client to reuse; defaults to the shared client when
+            one is installed, else a throwaway client per call.
 
     Returns:
         List of run dicts (run_id, status, created_at, etc.).
@@ -86,9 +125,14 @@ async def fetch_worker_runs(url: str, token: str, timeout: float = 10.0) -> list
     """
     runs_url = url.rstrip("/") + "/dashboard/runs"
     headers = {"Authorization": f"Bearer {token}"}
+    if client is None:
+        client = _shared_client
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(runs_url, headers=headers)
+        if client is not None:
+            response = await client.get(runs_url, headers=headers, timeout=timeout)
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as own_client:
+                response = await own_client.get(runs_url, headers=headers)
     except httpx.TimeoutException as exc:
         raise DispatchError(f"Timeout fetching runs from {runs_url}: {exc}") from exc
     except httpx.ConnectError as exc:
@@ -101,7 +145,11 @@ async def fetch_worker_runs(url: str, token: str, timeout: float = 10.0) -> list
 
 
 async def cancel_worker_run(
-    url: str, token: str, run_id: str, timeout: float = 10.0
+    url: str,
+    token: str,
+    run_id: str,
+    timeout: float = 10.0,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """DELETE /dispatch/{run_id} on the worker to request cancellation.
 
@@ -110,6 +158,8 @@ async def cancel_worker_run(
         token: Bearer token for authentication.
         run_id: The run ID to cancel.
         timeout: Request timeout in seconds.
+        client: Explicit client to reuse; defaults to the shared client when
+            one is installed, else a throwaway client per call.
 
     Returns:
         Worker's response dict (typically ``{"cancelled": bool, "run_id": str}``).
@@ -120,9 +170,14 @@ async def cancel_worker_run(
     """
     cancel_url = url.rstrip("/") + f"/dispatch/{run_id}"
     headers = {"Authorization": f"Bearer {token}"}
+    if client is None:
+        client = _shared_client
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.delete(cancel_url, headers=headers)
+        if client is not None:
+            response = await client.delete(cancel_url, headers=headers, timeout=timeout)
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as own_client:
+                response = await own_client.delete(cancel_url, headers=headers)
     except httpx.TimeoutException as exc:
         raise DispatchError(f"Timeout cancelling at {cancel_url}: {exc}") from exc
     except httpx.ConnectError as exc:
@@ -138,7 +193,12 @@ async def cancel_worker_run(
     return cast(dict[str, Any], response.json())
 
 
-async def proxy_worker_stream(url: str, token: str, run_id: str) -> AsyncIterator[bytes]:
+async def proxy_worker_stream(
+    url: str,
+    token: str,
+    run_id: str,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncIterator[bytes]:
     """Proxy an SSE stream from a worker's /dispatch/{run_id}/stream endpoint.
 
     Yields raw byte chunks from the upstream SSE stream. The browser's
@@ -148,6 +208,8 @@ async def proxy_worker_stream(url: str, token: str, run_id: str) -> AsyncIterato
         url: Base URL of the worker service.
         token: Bearer token for authentication.
         run_id: The run ID to stream.
+        client: Explicit client to reuse; defaults to the shared client when
+            one is installed, else a throwaway client per call.
 
     Yields:
         Raw byte chunks from the SSE stream.
@@ -158,15 +220,21 @@ async def proxy_worker_stream(url: str, token: str, run_id: str) -> AsyncIterato
     """
     stream_url = url.rstrip("/") + f"/dispatch/{run_id}/stream"
     headers = {"Authorization": f"Bearer {token}"}
+    if client is None:
+        client = _shared_client
     try:
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream("GET", stream_url, headers=headers) as response:
-                if response.status_code == 401:
-                    raise AuthError(f"Unauthorized (401) from {stream_url}")
-                if response.status_code != 200:
-                    raise DispatchError(f"HTTP {response.status_code} from {stream_url}")
-                async for chunk in response.aiter_bytes():
-                    yield chunk
+        async with AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(httpx.AsyncClient(timeout=None))
+            response = await stack.enter_async_context(
+                client.stream("GET", stream_url, headers=headers, timeout=None)
+            )
+            if response.status_code == 401:
+                raise AuthError(f"Unauthorized (401) from {stream_url}")
+            if response.status_code != 200:
+                raise DispatchError(f"HTTP {response.status_code} from {stream_url}")
+            async for chunk in response.aiter_bytes():
+                yield chunk
     except httpx.ConnectError as exc:
         raise DispatchError(f"Connection error streaming from {stream_url}: {exc}") from exc
     except httpx.RequestError as exc:
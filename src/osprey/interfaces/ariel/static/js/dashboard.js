@@ -16,6 +16,10 @@ import {
 // Refresh interval
 let refreshInterval = null;
 
+// Markup from the last successful render, so background refreshes can skip
+// the innerHTML teardown/rebuild when nothing changed.
+let lastStatusHtml = '';
+
 /**
  * Initialize dashboard module.
  */
@@ -31,13 +35,16 @@ export async function loadStatus() {
   const container = document.getElementById('status-content');
   if (!container) return;
 
-  container.innerHTML = renderLoading('Loading status...');
+  // Show the loading placeholder only on first load — blanking the page on
+  // every 30s auto-refresh makes the whole dashboard flicker.
+  if (!lastStatusHtml) container.innerHTML = renderLoading('Loading status...');
 
   try {
     const status = await statusApi.get();
     renderStatus(container, status);
   } catch (error) {
     console.error('Failed to load status:', error);
+    lastStatusHtml = '';
     container.innerHTML = `
       <div class="empty-state">
         <h3 class="empty-state-title text-error">Failed to Load Status</h3>
@@ -56,7 +63,7 @@ function renderStatus(container, status) {
   const healthStatus = status.healthy ? 'healthy' : 'error';
   const healthLabel = status.healthy ? 'ARIEL is healthy' : 'ARIEL has issues';
 
-  container.innerHTML = `
+  const html = `
     <!-- Overall Health -->
     <div class="card" style="margin-bottom: 24px;">
       <div class="card-body" style="display: flex; align-items: center; gap: 16px;">
@@ -162,6 +169,10 @@ function renderStatus(container, status) {
       </div>
     ` : ''}
   `;
+
+  if (html === lastStatusHtml) return;
+  lastStatusHtml = html;
+  container.innerHTML = html;
 }
 
 /**
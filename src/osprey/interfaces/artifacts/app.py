@@ -197,6 +197,9 @@ _RESPONSIVE_SNIPPETS = {
 # Standalone HTML page for server-side rendered markdown.
 # Embeds raw markdown as JSON inside a non-executable <script> tag, then
 # renders client-side using the same marked + hljs + KaTeX pipeline as gallery.js.
+# Page styles and the render script live in static/css/markdown-page.css and
+# static/js/markdown-page.js so the browser parses and caches them once
+# instead of re-downloading an inline copy with every rendered artifact.
 _MARKDOWN_PAGE_TEMPLATE = """\
 <!DOCTYPE html>
 <html lang="en">
@@ -209,103 +212,12 @@ _MARKDOWN_PAGE_TEMPLATE = """\
 <script src="/static/js/vendor/marked.min.js"></script>
 <link rel="stylesheet" href="/static/css/vendor/katex.min.css">
 <script src="/static/js/vendor/katex.min.js"></script>
-<style>
-body {{
-  margin: 0; padding: 24px 32px;
-  font-family: system-ui, -apple-system, sans-serif;
-  background: #fff; color: #111;
-}}
-.osprey-md-rendered {{
-  font-size: 14px; line-height: 1.7; max-width: 860px; margin: 0 auto;
-}}
-.osprey-md-rendered h1,.osprey-md-rendered h2,.osprey-md-rendered h3 {{
-  margin-top: 1.2em;
-}}
-.osprey-md-rendered pre,.osprey-md-rendered code {{
-  background: #f5f5f5; border-radius: 3px; padding: 2px 4px; font-size: 12px;
-}}
-.osprey-md-rendered pre {{ padding: 12px; overflow-x: auto; }}
-.osprey-md-rendered pre code {{ padding: 0; background: transparent; }}
-.osprey-md-rendered table {{ border-collapse: collapse; width: 100%; }}
-.osprey-md-rendered th,.osprey-md-rendered td {{
-  border: 1px solid #ddd; padding: 6px 10px;
-}}
-.osprey-md-rendered blockquote {{
-  border-left: 3px solid #ddd; margin: 1em 0; padding: 0.5em 1em; color: #555;
-}}
-.osprey-md-rendered img {{ max-width: 100%; height: auto; }}
-@media print {{
-  body {{ padding: 12px; }}
-}}
-</style>
+<link rel="stylesheet" href="/static/css/markdown-page.css">
 </head>
 <body>
 <script type="application/json" id="md-source">{md_json}</script>
 <div class="osprey-md-rendered" id="md-rendered"></div>
-<script>
-// Renders markdown from the embedded JSON source using marked + hljs + KaTeX.
-// Content originates from trusted local artifact files; marked.parse() and
-// katex.renderToString() both produce sanitized HTML output.
-(function() {{
-  var esc = function(s) {{
-    return s.replace(/&/g,'&amp;').replace(/</g,'&lt;')
-            .replace(/>/g,'&gt;').replace(/"/g,'&quot;');
-  }};
-  var renderer = {{
-    code: function(args) {{
-      var src = args.text || '';
-      var lang = args.lang || '';
-      var highlighted = esc(src);
-      if (typeof hljs !== 'undefined' && src) {{
-        try {{
-          if (lang && hljs.getLanguage(lang)) {{
-            highlighted = hljs.highlight(src, {{ language: lang }}).value;
-          }} else {{
-            highlighted = hljs.highlightAuto(src).value;
-          }}
-        }} catch(e) {{}}
-      }}
-      return '<pre><code class="hljs' + (lang ? ' language-' + lang : '') +
-             '">' + highlighted + '</code></pre>';
-    }}
-  }};
-  marked.use({{ gfm: true, breaks: false, renderer: renderer }});
-
-  function renderMath(text) {{
-    if (typeof katex === 'undefined') return marked.parse(text);
-    var placeholders = [], idx = 0;
-    function ph(html) {{
-      var key = '\\x00MATH' + (idx++) + '\\x00';
-      placeholders.push({{ key: key, html: html }});
-      return key;
-    }}
-    function rk(expr, dm) {{
-      try {{
-        return katex.renderToString(expr.trim(), {{
-          displayMode: dm, throwOnError: false, strict: false
-        }});
-      }} catch(e) {{
-        return '<span class="katex-error">' + esc(expr) + '</span>';
-      }}
-    }}
-    text = text.replace(/\\$\\$([\\s\\S]+?)\\$\\$/g, function(_, e) {{ return ph(rk(e, true)); }});
-    text = text.replace(/(?<!\\$)(?<!\\d)\\$(?!\\$)(.+?)(?<!\\$)\\$(?!\\d)/g,
-      function(_, e) {{ return ph(rk(e, false)); }});
-    var html;
-    try {{ html = marked.parse(text); }}
-    catch(e) {{ html = '<p>' + esc(text) + '</p>'; }}
-    for (var i = 0; i < placeholders.length; i++) {{
-      html = html.replace(placeholders[i].key, placeholders[i].html);
-    }}
-    return html;
-  }}
-
-  var src = JSON.parse(document.getElementById('md-source').textContent);
-  // Safe: marked.parse() and katex.renderToString() produce sanitized HTML
-  // from trusted local artifact content (not user input from the web).
-  document.getElementById('md-rendered').innerHTML = renderMath(src);  // trusted content
-}})();
-</script>
+<script src="/static/js/markdown-page.js"></script>
 </body>
 </html>"""
 
@@ -446,9 +358,15 @@ def create_app(workspace_root: Path | None = None) -> FastAPI:
         broadcaster.broadcast({"type": "artifact", **entry.to_dict()})
 
     def _on_artifact_deleted(entry: ArtifactEntry) -> None:
-        if app.state.focused_artifact_id == entry.id:
+        was_focused = app.state.focused_artifact_id == entry.id
+        if was_focused:
             app.state.focused_artifact_id = None
-        _write_focus_file()
+        # Only focused or pinned entries appear in the focus file, so other
+        # deletions can skip the rewrite (and its full pinned-entry scan) —
+        # delete_all fires this listener once per entry, which otherwise
+        # makes clearing N artifacts O(N) focus-file rebuilds.
+        if was_focused or entry.pinned:
+            _write_focus_file()
         broadcaster.broadcast({"type": "artifact_deleted", "id": entry.id})
 
     @asynccontextmanager
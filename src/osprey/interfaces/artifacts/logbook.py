@@ -110,9 +110,10 @@ async def gather_context(
     artifacts_meta: list[dict[str, Any]] = []
 
     if artifact_ids is not None:
-        # Multi-artifact mode
+        # Multi-artifact mode — one batched lookup instead of a stat per id
+        entries = artifact_store.get_entries(artifact_ids)
         for aid in artifact_ids:
-            entry = artifact_store.get_entry(aid)
+            entry = entries.get(aid)
             if entry is not None:
                 artifacts_meta.append(entry.to_dict())
         # Set artifact_meta to first for backward compat (artifact_ids in response)
@@ -140,19 +140,23 @@
     return `${size.toFixed(i === 0 ? 0 : 1)} ${units[i]}`;
   }
 
+  // Shared formatters — toLocaleTimeString/toLocaleString with options build
+  // a new Intl.DateTimeFormat on every call, and these run per sidebar item
+  // on each render.
+  const TIME_FORMAT = new Intl.DateTimeFormat(undefined, { hour: "2-digit", minute: "2-digit" });
+  const FULL_TIME_FORMAT = new Intl.DateTimeFormat(undefined, {
+    year: "numeric", month: "short", day: "numeric",
+    hour: "2-digit", minute: "2-digit",
+  });
+
   function formatTime(iso) {
     if (!iso) return "";
-    const d = new Date(iso);
-    return d.toLocaleTimeString(undefined, { hour: "2-digit", minute: "2-digit" });
+    return TIME_FORMAT.format(new Date(iso));
   }
 
   function formatFullTime(iso) {
     if (!iso) return "";
-    const d = new Date(iso);
-    return d.toLocaleString(undefined, {
-      year: "numeric", month: "short", day: "numeric",
-      hour: "2-digit", minute: "2-digit",
-    });
+    return FULL_TIME_FORMAT.format(new Date(iso));
   }
 
   function formatDate(iso) {
@@ -645,6 +649,33 @@
     });
   }
 
+  /**
+   * Patch a single sidebar entry in place after an artifact_updated event.
+   * Rebuilding the whole sidebar innerHTML (and re-attaching every click,
+   * dblclick, and drag handler) churns hundreds of nodes for a one-item
+   * change; only the title and size can change on update, so rewrite just
+   * those text nodes. Falls back to a full render when the item isn't in
+   * the DOM yet or is pinned (the pin indicator lives inside the title
+   * markup).
+   */
+  function patchSidebarItem(a) {
+    const el = sidebarBody.querySelector(`[data-id="${a.id}"]`);
+    if (!el || a.pinned || el.classList.contains("pinned")) {
+      renderSidebar();
+      return;
+    }
+    const titleEl = el.querySelector(".tree-item-name, .timeline-item-title, .gallery-card-title");
+    if (titleEl && titleEl.textContent.trim() !== a.title) {
+      titleEl.textContent = a.title;
+      titleEl.title = a.title;
+    }
+    const sizeEl = el.querySelector(".tree-item-size, .gallery-card-size");
+    if (sizeEl) {
+      const size = formatSize(a.size_bytes);
+      if (sizeEl.textContent !== size) sizeEl.textContent = size;
+    }
+  }
+
   // ---- Preview Pane ----
 
   function renderPreview() {
@@ -1497,7 +1528,7 @@
             selectedArtifact = artifacts[idx];
             renderPreview();
           }
-          renderSidebar();
+          patchSidebarItem(artifacts[idx]);
         }
         return;
       }
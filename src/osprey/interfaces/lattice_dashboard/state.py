@@ -136,6 +136,12 @@ class LatticeState:
         self._state_path = self._dir / "state.json"
         self._baseline_path = self._dir / "baseline.json"
         self._lock = threading.Lock()
+        # Parsed-state cache keyed on the file's mtime. The dashboard polls
+        # load() frequently; when nothing (including the workers, which write
+        # through their own LatticeState) has touched the file, a stat() is
+        # enough to skip the re-parse. Guarded by ``_lock``.
+        self._cache: dict[str, Any] | None = None
+        self._cache_mtime: float = -1.0
 
     @property
     def state_path(self) -> Path:
@@ -155,7 +161,15 @@ class LatticeState:
 
     def _load_unlocked(self) -> dict[str, Any]:
         if self._state_path.exists():
-            return json.loads(self._state_path.read_text())
+            mtime = self._state_path.stat().st_mtime
+            if self._cache is not None and mtime == self._cache_mtime:
+                # Deep-copy so callers can mutate the result without
+                # corrupting the cache behind an unsaved edit.
+                return copy.deepcopy(self._cache)
+            state = json.loads(self._state_path.read_text())
+            self._cache = copy.deepcopy(state)
+            self._cache_mtime = mtime
+            return state
         return self._empty_state()
 
     def save(self, state: dict[str, Any]) -> None:
@@ -164,6 +178,8 @@ class LatticeState:
 
     def _save_unlocked(self, state: dict[str, Any]) -> None:
         self._state_path.write_text(json.dumps(state, indent=2, default=str))
+        self._cache = copy.deepcopy(state)
+        self._cache_mtime = self._state_path.stat().st_mtime
 
     @staticmethod
     def _empty_state() -> dict[str, Any]:
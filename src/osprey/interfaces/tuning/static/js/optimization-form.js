@@ -81,8 +81,13 @@ export function initOptimizationForm() {
   els.resumeBtn.addEventListener('click', resumeOptimization);
   els.cancelBtn.addEventListener('click', cancelOptimization);
 
+  // Delegated table events (one listener per table, not per row)
+  bindTableEvents(els.lhsTableBody);
+  bindTableEvents(els.boTableBody);
+
   // State subscriptions
   state.on('variableTableChanged', renderTables);
+  state.on('variableChanged', patchVariableRow);
   state.on('pageStateChanged', updateControlButtons);
   state.on('environmentChanged', onEnvironmentChanged);
   state.on('resetForNewRun', resetForm);
@@ -125,10 +130,13 @@ function renderTable(tbody, showBoRange) {
     return;
   }
 
-  tbody.innerHTML = '';
+  // Build rows on a detached fragment and attach once — appending to the
+  // live tbody re-runs layout per row.
+  const frag = document.createDocumentFragment();
   for (const v of data) {
     const tr = document.createElement('tr');
     tr.className = v.selected ? 'selected' : '';
+    tr.dataset.pv = v.pv_name;
 
     tr.innerHTML = `
       <td class="col-check"><input type="checkbox" data-pv="${v.pv_name}" ${v.selected ? 'checked' : ''}></td>
@@ -140,21 +148,46 @@ function renderTable(tbody, showBoRange) {
       ${showBoRange ? `<td><input class="input" type="number" data-pv="${v.pv_name}" data-field="bo_range_factor" value="${v.bo_range_factor ?? 1}" step="0.1"></td>` : ''}
     `;
 
-    // Checkbox toggle
-    tr.querySelector('input[type="checkbox"]').addEventListener('change', (e) => {
-      state.updateVariable(v.pv_name, { selected: e.target.checked });
-    });
-
-    // Editable fields
-    tr.querySelectorAll('input[data-field]').forEach(input => {
-      input.addEventListener('change', (e) => {
-        const field = e.target.dataset.field;
-        const val = e.target.value === '' ? null : parseFloat(e.target.value);
-        state.updateVariable(v.pv_name, { [field]: val });
-      });
-    });
-
-    tbody.appendChild(tr);
+    frag.appendChild(tr);
+  }
+
+  tbody.innerHTML = '';
+  tbody.appendChild(frag);
+}
+
+function bindTableEvents(tbody) {
+  // Delegated change handler: rebuilding the table used to allocate two
+  // listener closures per row, re-created on every rebuild. A single
+  // listener on the tbody covers rows built later for free.
+  tbody.addEventListener('change', (e) => {
+    const pvName = e.target.dataset.pv;
+    if (!pvName) return;
+    if (e.target.type === 'checkbox') {
+      state.updateVariable(pvName, { selected: e.target.checked });
+    } else if (e.target.dataset.field) {
+      const val = e.target.value === '' ? null : parseFloat(e.target.value);
+      state.updateVariable(pvName, { [e.target.dataset.field]: val });
+    }
+  });
+}
+
+function patchVariableRow({ pvName, variable }) {
+  // Single-variable edit: update the affected row in both tables instead of
+  // rebuilding them. Rebuilding tears down every row's input elements, which
+  // drops focus mid-edit and costs O(rows) for a one-checkbox toggle.
+  for (const tbody of [els.lhsTableBody, els.boTableBody]) {
+    const tr = tbody.querySelector(`tr[data-pv="${CSS.escape(pvName)}"]`);
+    if (!tr) {
+      renderTables();
+      return;
+    }
+    tr.className = variable.selected ? 'selected' : '';
+    tr.querySelector('input[type="checkbox"]').checked = variable.selected;
+    for (const input of tr.querySelectorAll('input[data-field]')) {
+      const field = input.dataset.field;
+      const next = variable[field] ?? (field === 'bo_range_factor' ? 1 : '');
+      if (input.value !== String(next)) input.value = next;
+    }
   }
 }
 
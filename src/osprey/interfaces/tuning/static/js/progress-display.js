@@ -9,6 +9,7 @@ import { state } from './state.js';
 import { createOptimizationPlot } from './plots.js';
 
 let pollTimer = null;
+let lastRenderedRows = null;
 let plotContainer;
 let logOutput;
 let resultsTableBody;
@@ -160,6 +161,7 @@ function updateResultsTable(optState) {
   if (allData.length === 0) {
     resultsTableBody.innerHTML = '<tr class="empty-row"><td colspan="3">No results yet</td></tr>';
     if (resultsPagination) resultsPagination.innerHTML = '';
+    lastRenderedRows = null;
     return;
   }
 
@@ -168,13 +170,25 @@ function updateResultsTable(optState) {
   const start = currentPage * PAGE_SIZE;
   const pageData = allData.slice(start, start + PAGE_SIZE);
 
+  const rows = pageData.map(d => [
+    d.iter,
+    typeof d.objective_value === 'number' ? d.objective_value.toFixed(6) : (d.objective ?? '--'),
+    d.phase,
+  ]);
+
+  // Mid-iteration the visible page is unchanged across most 500ms polls —
+  // skip the row/pagination rebuild when the formatted values are identical.
+  const renderKey = `${currentPage}/${totalPages}|` + rows.map(r => r.join(',')).join(';');
+  if (renderKey === lastRenderedRows) return;
+  lastRenderedRows = renderKey;
+
   resultsTableBody.innerHTML = '';
-  for (const d of pageData) {
+  for (const r of rows) {
     const tr = document.createElement('tr');
     tr.innerHTML = `
-      <td>${d.iter}</td>
-      <td class="muted">${typeof d.objective_value === 'number' ? d.objective_value.toFixed(6) : (d.objective ?? '--')}</td>
-      <td>${d.phase}</td>
+      <td>${r[0]}</td>
+      <td class="muted">${r[1]}</td>
+      <td>${r[2]}</td>
     `;
     resultsTableBody.appendChild(tr);
   }
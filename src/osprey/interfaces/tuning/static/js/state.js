@@ -103,7 +103,10 @@ class TuningState {
     const idx = this.variableTableData.findIndex(v => v.pv_name === pvName);
     if (idx >= 0) {
       this.variableTableData[idx] = { ...this.variableTableData[idx], ...updates };
-      this.emit('variableTableChanged', this.variableTableData);
+      // Single-row edits (checkbox toggle, range field change) emit a targeted
+      // event so the form can patch one row in place; the full-rebuild
+      // 'variableTableChanged' stays reserved for structural changes.
+      this.emit('variableChanged', { pvName, variable: this.variableTableData[idx] });
     }
   }
 
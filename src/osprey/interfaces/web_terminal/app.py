@@ -350,10 +350,10 @@ def _create_lifespan(
         # — mirroring `osprey claude chat` — means an edited config.yml is honored
         # on the next server start. Fail open so a regen error never blocks launch.
         try:
-            from osprey.cli.templates.manager import TemplateManager
+            from osprey.cli.templates.manager import get_template_manager
 
             project_dir_for_regen = Path(app.state.project_cwd)
-            changed = TemplateManager().regen_if_drift(project_dir_for_regen)
+            changed = get_template_manager().regen_if_drift(project_dir_for_regen)
             if changed:
                 logger.info(
                     "Regenerated %d stale Claude Code artifact(s): %s",
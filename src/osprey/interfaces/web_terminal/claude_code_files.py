@@ -30,6 +30,27 @@ class ClaudeCodeFileService:
         "safety.md": "Safety",
     }
 
+    # Path-fragment → category fallbacks, checked in order after
+    # ``_KNOWN_CATEGORIES``.
+    _PATH_CATEGORIES: tuple[tuple[str, str], ...] = (
+        ("agents/", "Agents"),
+        ("skills/", "Skills"),
+        ("commands/", "Commands"),
+        ("hooks/", "Hooks"),
+        ("rules/", "Safety"),
+        ("output-styles/", "Output Styles"),
+    )
+
+    # Filename suffix → syntax-highlighting language
+    _SUFFIX_LANGUAGES: tuple[tuple[str, str], ...] = (
+        (".md", "markdown"),
+        (".json", "json"),
+        (".yml", "yaml"),
+        (".yaml", "yaml"),
+        (".sh", "shell"),
+        (".py", "python"),
+    )
+
     def __init__(self, project_dir: Path):
         self.project_dir = project_dir.resolve()
 
@@ -43,11 +64,12 @@ class ClaudeCodeFileService:
         files: list[dict] = []
 
         for fpath, rel_path in targets:
-            if not fpath.exists() or not fpath.is_file():
-                continue
+            # _collect_targets already established these are regular files;
+            # re-checking exists()/is_file() here would stat each path twice
+            # more. The read itself guards against deletion races.
             try:
                 content = fpath.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, PermissionError):
+            except (OSError, UnicodeDecodeError):
                 continue
 
             files.append(
@@ -176,33 +198,19 @@ class ClaudeCodeFileService:
         """Determine the category for a Claude Code integration file."""
         if name in ClaudeCodeFileService._KNOWN_CATEGORIES:
             return ClaudeCodeFileService._KNOWN_CATEGORIES[name]
-        if "agents/" in rel_path or name.endswith("-agent.md"):
+        if name.endswith("-agent.md"):
             return "Agents"
-        if "skills/" in rel_path:
-            return "Skills"
-        if "commands/" in rel_path:
-            return "Commands"
-        if "hooks/" in rel_path:
-            return "Hooks"
-        if "rules/" in rel_path:
-            return "Safety"
-        if "output-styles/" in rel_path:
-            return "Output Styles"
+        for fragment, category in ClaudeCodeFileService._PATH_CATEGORIES:
+            if fragment in rel_path:
+                return category
         return "Other"
 
     @staticmethod
     def detect_language(name: str) -> str:
         """Infer language/format from filename."""
-        if name.endswith(".md"):
-            return "markdown"
-        if name.endswith(".json"):
-            return "json"
-        if name.endswith((".yml", ".yaml")):
-            return "yaml"
-        if name.endswith(".sh"):
-            return "shell"
-        if name.endswith(".py"):
-            return "python"
+        for suffix, language in ClaudeCodeFileService._SUFFIX_LANGUAGES:
+            if name.endswith(suffix):
+                return language
         return "text"
 
     # ------------------------------------------------------------------
@@ -210,11 +218,19 @@ class ClaudeCodeFileService:
     # ------------------------------------------------------------------
 
     def _collect_targets(self) -> list[tuple[Path, str]]:
-        """Build the ordered list of (absolute_path, relative_path) targets."""
+        """Build the ordered list of (absolute_path, relative_path) targets.
+
+        Every returned path has been verified to be a regular file, so
+        callers can read without re-statting.
+        """
         targets: list[tuple[Path, str]] = [
-            (self.project_dir / "CLAUDE.md", "CLAUDE.md"),
-            (self.project_dir / ".mcp.json", ".mcp.json"),
-            (self.project_dir / ".claude" / "settings.json", ".claude/settings.json"),
+            (path, rel)
+            for path, rel in (
+                (self.project_dir / "CLAUDE.md", "CLAUDE.md"),
+                (self.project_dir / ".mcp.json", ".mcp.json"),
+                (self.project_dir / ".claude" / "settings.json", ".claude/settings.json"),
+            )
+            if path.is_file()
         ]
 
         claude_dir = self.project_dir / ".claude"
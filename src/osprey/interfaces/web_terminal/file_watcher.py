@@ -49,6 +49,23 @@ class FileEventBroadcaster:
 _IGNORE_PATTERNS = {".git", "__pycache__", ".DS_Store", "_notebook_cache"}
 _IGNORE_EXTENSIONS = {".pyc", ".pyo"}
 
+# Prune the per-path debounce map once it exceeds this many entries. The map
+# otherwise accumulates one timestamp per unique path ever seen for the
+# lifetime of the server; entries older than the debounce window can never
+# suppress another event, so they are safe to drop.
+_DEBOUNCE_MAP_MAX = 4096
+
+# Watchdog event type -> simplified type broadcast to clients. Frozen at module
+# level so the hot event handler does a single dict probe instead of
+# reallocating the mapping per event.
+_EVENT_TYPE_MAP = {
+    "created": "created",
+    "modified": "modified",
+    "deleted": "deleted",
+    "moved": "modified",
+    "closed": "modified",
+}
+
 
 class _WorkspaceHandler(FileSystemEventHandler):
     """Watchdog handler that filters and debounces file events."""
@@ -77,14 +94,11 @@ class _WorkspaceHandler(FileSystemEventHandler):
             return
         self._last_event[key] = now
 
-        event_type_map = {
-            "created": "created",
-            "modified": "modified",
-            "deleted": "deleted",
-            "moved": "modified",
-            "closed": "modified",
-        }
-        simple_type = event_type_map.get(event.event_type)
+        if len(self._last_event) > _DEBOUNCE_MAP_MAX:
+            cutoff = now - self._debounce_seconds
+            self._last_event = {k: v for k, v in self._last_event.items() if v >= cutoff}
+
+        simple_type = _EVENT_TYPE_MAP.get(event.event_type)
         if simple_type is None:
             return
 
@@ -150,16 +150,37 @@ class PtySession:
 
     @staticmethod
     def _blocking_read(fd: int) -> bytes:
-        """Blocking read with short timeout for cancellation responsiveness."""
+        """Blocking read with short timeout for cancellation responsiveness.
+
+        Coalesces bursts of output: during heavy TUI repaints the PTY
+        produces data faster than one 4 KB chunk per executor round-trip,
+        and every chunk becomes its own WebSocket frame. After the first
+        read, keep draining (zero-timeout select) up to a 64 KB cap so a
+        burst arrives as one frame instead of many.
+        """
         import select
 
         readable, _, _ = select.select([fd], [], [], 0.1)
-        if readable:
+        if not readable:
+            return b""
+
+        chunks: list[bytes] = []
+        total = 0
+        while True:
             try:
-                return os.read(fd, 4096)
+                data = os.read(fd, 4096)
             except OSError:
-                return b""
-        return b""
+                break
+            if not data:
+                break
+            chunks.append(data)
+            total += len(data)
+            if total >= 65536:
+                break
+            readable, _, _ = select.select([fd], [], [], 0)
+            if not readable:
+                break
+        return b"".join(chunks)
 
     def write_input(self, data: bytes) -> None:
         """Write raw bytes to the PTY (keystrokes from the client)."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 import shutil
@@ -50,9 +52,9 @@ def _regen_if_drift(request: Request) -> list[str]:
     if project_dir is None:
         return []
     try:
-        from osprey.cli.templates.manager import TemplateManager
+        from osprey.cli.templates.manager import get_template_manager
 
-        return TemplateManager().regen_if_drift(project_dir)
+        return get_template_manager().regen_if_drift(project_dir)
     except Exception:  # noqa: BLE001 — config write already succeeded; never raise here
         logger.warning("Claude Code artifact regen after config write failed", exc_info=True)
         return []
@@ -101,22 +103,36 @@ async def put_config(body: ConfigUpdate, request: Request):
     except yaml.YAMLError as e:
         raise HTTPException(status_code=422, detail=f"Invalid YAML: {e}") from e
 
-    # Backup existing config
+    # Backup + write + regen all hit disk (fsync included); run them in a
+    # worker thread so a slow or network-mounted filesystem doesn't stall the
+    # event loop that is also streaming PTY output.
+    await asyncio.to_thread(_backup_and_write, config_path, body.raw)
+    regenerated = await asyncio.to_thread(_regen_if_drift, request)
+    return {"status": "ok", "requires_restart": True, "regenerated": regenerated}
+
+
+def _backup_and_write(config_path: Path, raw: str) -> None:
+    """Back up config.yml and write the new content with an fsync."""
     if config_path.exists():
         backup_path = config_path.with_suffix(".yml.bak")
         shutil.copy2(config_path, backup_path)
         logger.info("Config backed up to %s", backup_path)
 
-    # Write new config (fsync to ensure data is on disk before restart)
-    with open(config_path, "w", encoding="utf-8") as f:
-        f.write(body.raw)
-        f.flush()
-        os.fsync(f.fileno())
+    # Write to a temp file and replace atomically (fsync first so the data is
+    # on disk before restart); an in-place write truncates and would corrupt
+    # config.yml on a crash mid-write.
+    tmp_path = config_path.with_suffix(".yml.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     logger.info("Config updated at %s", config_path)
 
-    regenerated = _regen_if_drift(request)
-    return {"status": "ok", "requires_restart": True, "regenerated": regenerated}
-
 
 class ConfigPatch(BaseModel):
     updates: dict[str, object]
@@ -139,12 +155,13 @@ async def patch_config(body: ConfigPatch, request: Request):
     if not body.updates:
         raise HTTPException(status_code=422, detail="No updates provided")
 
-    # Backup before mutation
+    # Backup before mutation; the ruamel round-trip parse/dump is blocking,
+    # so keep it off the event loop too.
     backup_path = config_path.with_suffix(".yml.bak")
-    shutil.copy2(config_path, backup_path)
+    await asyncio.to_thread(shutil.copy2, config_path, backup_path)
 
     try:
-        config_update_fields(config_path, body.updates)
+        await asyncio.to_thread(config_update_fields, config_path, body.updates)
     except Exception as e:
         # Restore backup on failure
         shutil.copy2(backup_path, config_path)
@@ -152,7 +169,7 @@ async def patch_config(body: ConfigPatch, request: Request):
         raise HTTPException(status_code=500, detail=f"Config update failed: {e}") from e
 
     logger.info("Config patched (%d fields) at %s", len(body.updates), config_path)
-    regenerated = _regen_if_drift(request)
+    regenerated = await asyncio.to_thread(_regen_if_drift, request)
     return {
         "status": "ok",
         "requires_restart": True,
@@ -182,8 +199,6 @@ async def get_hook_debug_status(request: Request):
 @router.get("/api/hooks/debug-log")
 async def get_hook_debug_log(request: Request, limit: int = 50):
     """Return recent hook debug log entries from hook_debug.jsonl."""
-    import json
-
     project_cwd = getattr(request.app.state, "project_cwd", None)
     if not project_cwd:
         return {"entries": []}
@@ -221,9 +236,14 @@ class ClaudeSetupSaveRequest(BaseModel):
 
 @router.get("/api/claude-setup")
 async def get_claude_setup(request: Request):
-    """Read all Claude Code integration files from the project directory."""
+    """Read all Claude Code integration files from the project directory.
+
+    The discovery rglobs ``.claude/`` and reads every file's content, so it
+    runs in a thread to keep the event loop (and the PTY websocket it also
+    serves) responsive.
+    """
     service = ClaudeCodeFileService(Path(request.app.state.project_cwd))
-    return {"files": service.list_files()}
+    return {"files": await asyncio.to_thread(service.list_files)}
 
 
 @router.put("/api/claude-setup")
@@ -231,7 +251,7 @@ async def save_claude_setup(request: Request, body: ClaudeSetupSaveRequest):
     """Save an existing Claude Code file."""
     service = ClaudeCodeFileService(Path(request.app.state.project_cwd))
     try:
-        return service.write_file(body.path, body.content)
+        return await asyncio.to_thread(service.write_file, body.path, body.content)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
     except PermissionError as e:
@@ -245,7 +265,7 @@ async def create_claude_setup(request: Request, body: ClaudeSetupSaveRequest):
     """Create a new Claude Code file in an allowed .claude/ subdirectory."""
     service = ClaudeCodeFileService(Path(request.app.state.project_cwd))
     try:
-        return service.create_file(body.path, body.content)
+        return await asyncio.to_thread(service.create_file, body.path, body.content)
     except FileExistsError as e:
         raise HTTPException(status_code=409, detail=str(e)) from e
     except PermissionError as e:
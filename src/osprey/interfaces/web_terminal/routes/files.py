@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import re
+import stat
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
@@ -47,11 +48,16 @@ async def file_tree(request: Request):
 
         children = []
         try:
-            entries = sorted(directory.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
+            # Stat each entry's type once; the sort key and the branch below
+            # share the result instead of issuing a second is_dir() stat.
+            entries = sorted(
+                ((p, p.is_dir()) for p in directory.iterdir()),
+                key=lambda item: (not item[1], item[0].name.lower()),
+            )
         except PermissionError:
             entries = []
 
-        for entry in entries:
+        for entry, entry_is_dir in entries:
             # Skip hidden/ignored
             if entry.name.startswith(".") or entry.name in (
                 "__pycache__",
@@ -60,7 +66,7 @@ async def file_tree(request: Request):
             ):
                 continue
 
-            if entry.is_dir():
+            if entry_is_dir:
                 children.append(build_tree(entry, depth + 1))
             else:
                 children.append(
@@ -86,14 +92,18 @@ async def file_content(filepath: str, request: Request):
     if not resolved.is_relative_to(workspace_dir.resolve()):
         raise HTTPException(status_code=403, detail="Path traversal blocked")
 
-    if not resolved.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    # One stat() answers existence, type and size — exists()/is_file() would
+    # each repeat the same kernel call on the same path.
+    try:
+        st = resolved.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="File not found") from None
 
-    if not resolved.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=400, detail="Not a file")
 
     # Limit file size to 1MB for preview
-    size = resolved.stat().st_size
+    size = st.st_size
     if size > 1_048_576:
         raise HTTPException(status_code=413, detail="File too large for preview (>1MB)")
 
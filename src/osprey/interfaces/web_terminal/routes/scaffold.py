@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
@@ -25,9 +26,16 @@ def _scaffold_service(request: Request) -> ScaffoldGalleryService:
 async def list_scaffold(request: Request):
     """List all build artifacts with status and summary counts."""
     service = _scaffold_service(request)
-    artifacts = service.list_artifacts()
-    framework_count = sum(1 for a in artifacts if a["status"] == "framework")
-    user_owned_count = sum(1 for a in artifacts if a["status"] == "user-owned")
+    # Directory walk + registry classification is blocking disk work; run it
+    # off the event loop so gallery polling can't stall other requests.
+    artifacts = await asyncio.to_thread(service.list_artifacts)
+    framework_count = 0
+    user_owned_count = 0
+    for a in artifacts:
+        if a["status"] == "framework":
+            framework_count += 1
+        elif a["status"] == "user-owned":
+            user_owned_count += 1
     return {
         "artifacts": artifacts,
         "summary": {
@@ -46,7 +54,7 @@ class UntrackedRegisterRequest(BaseModel):
 async def list_untracked_scaffold(request: Request):
     """Detect files active in Claude Code but not managed by OSPREY."""
     service = _scaffold_service(request)
-    untracked = service.scan_untracked()
+    untracked = await asyncio.to_thread(service.scan_untracked)
     return {"untracked": untracked, "count": len(untracked)}
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import asdict
 
@@ -22,12 +23,17 @@ async def list_sessions(request: Request):
     return {"sessions": [asdict(s) for s in sessions]}
 
 
-def _read_session_events(request: Request, reader) -> list[dict]:
-    """Read session events, scoped to a session_id if provided."""
+async def _read_session_events(request: Request, reader) -> list[dict]:
+    """Read session events, scoped to a session_id if provided.
+
+    Runs the transcript parse in a worker thread: large sessions mean a
+    multi-megabyte read plus per-line JSON decode, which would otherwise
+    stall the event loop that is also streaming PTY output.
+    """
     session_id = request.query_params.get("session_id")
     if session_id:
-        return reader.read_session_by_id(session_id)
-    return reader.read_current_session()
+        return await asyncio.to_thread(reader.read_session_by_id, session_id)
+    return await asyncio.to_thread(reader.read_current_session)
 
 
 @router.get("/api/session-agents")
@@ -38,7 +44,7 @@ async def session_agents(request: Request):
         from osprey.mcp_server.workspace.transcript_reader import TranscriptReader
 
         reader = TranscriptReader(request.app.state.project_cwd)
-        events = _read_session_events(request, reader)
+        events = await _read_session_events(request, reader)
         agents = _build_agent_summary(events)
 
         # Group tool_call events by agent_id
@@ -70,7 +76,9 @@ async def session_agent_timeline(request: Request):
 
         reader = TranscriptReader(request.app.state.project_cwd)
         session_id = request.query_params.get("session_id")
-        timeline = reader.read_agent_timeline(agent_id, session_id=session_id)
+        timeline = await asyncio.to_thread(
+            reader.read_agent_timeline, agent_id, session_id=session_id
+        )
         return {"agent_id": agent_id, "timeline": timeline, "count": len(timeline)}
     except Exception:
         logger.debug("session-agent-timeline: failed", exc_info=True)
@@ -84,7 +92,7 @@ async def session_log(request: Request):
         from osprey.mcp_server.workspace.transcript_reader import TranscriptReader
 
         reader = TranscriptReader(request.app.state.project_cwd)
-        events = _read_session_events(request, reader)
+        events = await _read_session_events(request, reader)
 
         # Parse query filters
         agent_filter = request.query_params.get("agent")
@@ -187,9 +195,9 @@ async def session_chat(request: Request):
         reader = TranscriptReader(request.app.state.project_cwd)
         session_id = request.query_params.get("session_id")
         if session_id:
-            turns = reader.read_chat_history_by_id(session_id)
+            turns = await asyncio.to_thread(reader.read_chat_history_by_id, session_id)
         else:
-            turns = reader.read_current_chat_history()
+            turns = await asyncio.to_thread(reader.read_current_chat_history)
         return {"turns": turns, "count": len(turns)}
     except Exception:
         logger.debug("session-chat: no transcript available", exc_info=True)
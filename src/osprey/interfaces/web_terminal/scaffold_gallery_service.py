@@ -14,7 +14,7 @@ from typing import Any
 
 import yaml
 
-from osprey.cli.templates.manager import TemplateManager
+from osprey.cli.templates.manager import TemplateManager, get_template_manager
 from osprey.services.build_artifacts.catalog import BuildArtifact, BuildArtifactCatalog
 from osprey.services.build_artifacts.ownership import (
     get_user_owned,
@@ -197,8 +197,15 @@ class ScaffoldGalleryService:
             )
         )
 
-        additions = sum(1 for ln in diff_lines if ln.startswith("+") and not ln.startswith("+++"))
-        deletions = sum(1 for ln in diff_lines if ln.startswith("-") and not ln.startswith("---"))
+        # Single pass for both counts — diffs over large rendered templates
+        # were scanned twice for what is one classification per line.
+        additions = 0
+        deletions = 0
+        for ln in diff_lines:
+            if ln.startswith("+") and not ln.startswith("+++"):
+                additions += 1
+            elif ln.startswith("-") and not ln.startswith("---"):
+                deletions += 1
 
         return {
             "unified_diff": "".join(diff_lines),
@@ -564,7 +571,7 @@ class ScaffoldGalleryService:
     def _ensure_template_context(self) -> tuple[TemplateManager, dict[str, Any]]:
         """Return cached (manager, context) pair, creating on first call."""
         if self._manager is None:
-            self._manager = TemplateManager()
+            self._manager = get_template_manager()
             from osprey.cli.templates.claude_code import build_claude_code_context
 
             self._ctx = build_claude_code_context(
@@ -9,11 +9,15 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
 from osprey.cli.project_utils import encode_claude_project_path
 
 logger = logging.getLogger(__name__)
@@ -29,11 +33,35 @@ class SessionInfo:
     message_count: int
 
 
+class _NewSessionHandler(FileSystemEventHandler):
+    """Watchdog handler that flags the first new ``*.jsonl`` file."""
+
+    def __init__(self, before: set[str]) -> None:
+        self._before = before
+        self.session_id: str | None = None
+        self.found_event = threading.Event()
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.is_directory or self.found_event.is_set():
+            return
+        # Cover atomic writes too: a rename into place arrives as "moved".
+        path = Path(getattr(event, "dest_path", "") or event.src_path)
+        if path.suffix != ".jsonl" or path.stem in self._before:
+            return
+        self.session_id = path.stem
+        self.found_event.set()
+
+
 class SessionDiscovery:
     """Discover and inspect Claude Code session files on disk."""
 
     def __init__(self, project_dir: str | Path) -> None:
         self._project_dir = Path(project_dir).resolve()
+        # Metadata index keyed by session id: (mtime, size, SessionInfo).
+        # list_sessions() is called on every picker refresh; re-parsing every
+        # JSONL file each time is O(total transcript bytes), so only files
+        # whose stat changed are re-read.
+        self._info_cache: dict[str, tuple[float, int, SessionInfo]] = {}
 
     def _resolve_sessions_dir(self) -> Path:
         """Return the Claude projects directory for this project.
@@ -64,8 +92,14 @@ class SessionDiscovery:
             if allowed_ids is not None and path.stem not in allowed_ids:
                 continue
             try:
+                stat = path.stat()
+                cached = self._info_cache.get(path.stem)
+                if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                    results.append(cached[2])
+                    continue
                 info = self._parse_session_file(path)
                 if info is not None:
+                    self._info_cache[path.stem] = (stat.st_mtime, stat.st_size, info)
                     results.append(info)
             except Exception:
                 logger.debug("Skipping corrupt session file: %s", path.name)
@@ -85,7 +119,12 @@ class SessionDiscovery:
         return {p.stem for p in sessions_dir.glob("*.jsonl")}
 
     def discover_new_session(self, before: set[str], timeout: float = 15.0) -> str | None:
-        """Poll for a new JSONL file not in *before*.
+        """Wait for a new JSONL file not in *before*.
+
+        Uses a watchdog create-event subscription so the wait costs O(events)
+        rather than re-globbing the whole directory every 500ms; falls back to
+        the glob poll if the observer cannot start (e.g. inotify limits) or
+        the sessions directory does not exist yet.
 
         Args:
             before: Session IDs from :meth:`snapshot_session_ids`.
@@ -96,6 +135,34 @@ class SessionDiscovery:
         """
         sessions_dir = self._resolve_sessions_dir()
         deadline = time.monotonic() + timeout
+        if sessions_dir.is_dir():
+            handler = _NewSessionHandler(before)
+            observer = Observer()
+            try:
+                observer.schedule(handler, str(sessions_dir), recursive=False)
+                observer.daemon = True
+                observer.start()
+            except Exception:
+                logger.debug("Session watcher unavailable; falling back to polling")
+                return self._poll_for_new_session(sessions_dir, before, deadline)
+            try:
+                # Re-check once after subscribing: a file created between the
+                # caller's snapshot and observer.start() produces no event.
+                new_ids = {p.stem for p in sessions_dir.glob("*.jsonl")} - before
+                if new_ids:
+                    return new_ids.pop()
+                if handler.found_event.wait(max(0.0, deadline - time.monotonic())):
+                    return handler.session_id
+                return None
+            finally:
+                observer.stop()
+                observer.join(timeout=5)
+        return self._poll_for_new_session(sessions_dir, before, deadline)
+
+    def _poll_for_new_session(
+        self, sessions_dir: Path, before: set[str], deadline: float
+    ) -> str | None:
+        """Glob-poll fallback for :meth:`discover_new_session`."""
         while time.monotonic() < deadline:
             if sessions_dir.is_dir():
                 current = {p.stem for p in sessions_dir.glob("*.jsonl")}
@@ -62,11 +62,17 @@ function initStatusBar() {
     }
   });
 
-  // Update terminal dimensions display
+  // Update terminal dimensions display (skip the DOM write when unchanged \u2014
+  // this ticks every 500ms and the dims only change on resize)
+  let lastDims = '';
   setInterval(() => {
     const dims = getTerminalDimensions();
     if (dims && dimsEl) {
-      dimsEl.textContent = `${dims.cols}\u00D7${dims.rows}`;
+      const text = `${dims.cols}\u00D7${dims.rows}`;
+      if (text !== lastDims) {
+        lastDims = text;
+        dimsEl.textContent = text;
+      }
     }
   }, 500);
 
@@ -108,8 +108,15 @@ class MemoryGallery {
     this.summaryEl = _el('div', 'memory-summary');
     this.galleryView.appendChild(this.summaryEl);
 
-    // File list
+    // File list — one delegated click handler instead of a closure per card,
+    // which every search-filtered rebuild would re-allocate.
     this.fileListEl = _el('div', 'memory-file-list');
+    this.fileListEl.addEventListener('click', (e) => {
+      const card = e.target.closest('.memory-file-card');
+      if (!card) return;
+      const file = this.files.find(f => f.filename === card.dataset.filename);
+      if (file) this.openDetail(file);
+    });
     this.galleryView.appendChild(this.fileListEl);
 
     this.container.appendChild(this.galleryView);
@@ -209,13 +216,18 @@ class MemoryGallery {
       return a.filename.localeCompare(b.filename);
     });
 
+    // Build the cards detached and attach once — appending to the live list
+    // re-runs layout per card.
+    const frag = document.createDocumentFragment();
     for (const file of sorted) {
-      this.fileListEl.appendChild(this.renderFileCard(file));
+      frag.appendChild(this.renderFileCard(file));
     }
+    this.fileListEl.appendChild(frag);
   }
 
   renderFileCard(file) {
     const card = _el('div', 'memory-file-card');
+    card.dataset.filename = file.filename;
     if (file.is_primary) card.classList.add('memory-file-primary');
 
     // Icon
@@ -254,7 +266,6 @@ class MemoryGallery {
     }
     card.appendChild(badge);
 
-    card.addEventListener('click', () => this.openDetail(file));
     return card;
   }
 
@@ -133,6 +133,7 @@ export async function initPanelManager(panelId) {
     panelState[panel.id] = {
       url: null,
       healthy: false,
+      renderedHealthy: null,
       iframe: null,
       pollTimer: null,
       polling: false,
@@ -301,6 +302,7 @@ function addPanel(spec) {
   panelState[spec.id] = {
     url: null,
     healthy: false,
+    renderedHealthy: null,
     iframe: null,
     pollTimer: null,
     polling: false,
@@ -399,8 +401,7 @@ async function pollHealth(panel) {
     });
     const wasHealthy = state.healthy;
     state.healthy = resp.ok;
-    updateTabState(panel);
-    updateStatusBar(panel);
+    syncHealthUi(panel);
 
     // First time healthy — enable tab and auto-activate
     if (state.healthy && !wasHealthy) {
@@ -420,13 +421,26 @@ async function pollHealth(panel) {
     }
   } catch {
     state.healthy = false;
-    updateTabState(panel);
-    updateStatusBar(panel);
+    syncHealthUi(panel);
   } finally {
     state.polling = false;
   }
 }
 
+/**
+ * Re-render the tab LED and status-bar dot only when health actually
+ * changed. The maintenance poll fires every 10s per panel; reassigning
+ * the classNames on every tick forces a restyle for an identical state.
+ * renderedHealthy starts null so the first poll always paints.
+ */
+function syncHealthUi(panel) {
+  const state = panelState[panel.id];
+  if (state.renderedHealthy === state.healthy) return;
+  state.renderedHealthy = state.healthy;
+  updateTabState(panel);
+  updateStatusBar(panel);
+}
+
 // ---- Tab State ----
 
 function enableTab(panelId) {
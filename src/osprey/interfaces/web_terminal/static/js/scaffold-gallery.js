@@ -523,6 +523,10 @@ class ArtifactGallery {
       if (bPin >= 0) return 1;
       return a.localeCompare(b);
     });
+
+    // Assemble sections in a detached fragment and attach once at the end —
+    // appending each section to the live container re-runs layout per category.
+    const frag = document.createDocumentFragment();
     for (const cat of sortedCategories) {
       const section = document.createElement('div');
       section.className = 'prompts-category-section';
@@ -590,8 +594,9 @@ class ArtifactGallery {
         }
       }
 
-      this.categoriesEl.appendChild(section);
+      frag.appendChild(section);
     }
+    this.categoriesEl.appendChild(frag);
 
     if (filtered.length === 0) {
       this.categoriesEl.innerHTML = '<div class="prompts-empty">No matching artifacts found.</div>';
@@ -26,9 +26,12 @@ ConverterFn = Callable[[Path, Path], Coroutine[Any, Any, Path]]
 # ---------------------------------------------------------------------------
 
 
-def _wrap_in_html(title: str, body_html: str) -> str:
-    """Wrap content in a self-contained styled HTML page for rendering to PNG."""
-    return f"""<!DOCTYPE html>
+# Built once at import; the page shell (notably the CSS block) is static, so
+# per-attachment wrapping only pays for the two substitutions rather than
+# reassembling the whole template. Same idiom as the gallery's
+# ``_MARKDOWN_PAGE_TEMPLATE``.
+_HTML_PAGE_TEMPLATE = """\
+<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -77,6 +80,11 @@ def _wrap_in_html(title: str, body_html: str) -> str:
 </html>"""
 
 
+def _wrap_in_html(title: str, body_html: str) -> str:
+    """Wrap content in a self-contained styled HTML page for rendering to PNG."""
+    return _HTML_PAGE_TEMPLATE.format(title=title, body_html=body_html)
+
+
 # ---------------------------------------------------------------------------
 # Converter functions
 # ---------------------------------------------------------------------------
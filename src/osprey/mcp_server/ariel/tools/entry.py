@@ -50,8 +50,9 @@ async def _resolve_artifacts(artifact_ids: list[str]) -> list[str]:
     resolved: list[str] = []
     output_dir = Path(tempfile.mkdtemp(prefix="ariel_convert_"))
 
+    entries = store.get_entries(artifact_ids)
     for aid in artifact_ids:
-        entry = store.get_entry(aid)
+        entry = entries.get(aid)
         if entry is None:
             raise ValueError(f"Artifact '{aid}' not found.")
 
@@ -39,14 +39,18 @@ class ChannelFinderHierContext:
     def __init__(self) -> None:
         self._raw_config: dict[str, Any] = {}
         self._database: HierarchicalChannelDatabase | None = None
+        self._db_path: str | None = None
         self._feedback_store: FeedbackStore | None = None
         self._facility_name: str = "control system"
         self._initialized = False
 
     def initialize(self) -> None:
-        """Load config and initialize the database.
+        """Load config and resolve the database path.
 
         Called once during create_server(). Subsequent calls are no-ops.
+        The database itself is loaded lazily on first access — parsing the
+        full JSON tree at startup would delay server readiness for sessions
+        that never call a channel finder tool.
         """
         if self._initialized:
             return
@@ -59,14 +63,7 @@ class ChannelFinderHierContext:
         db_path = db_config.get("path")
 
         if db_path:
-            db_path = self._resolve_path(db_path)
-
-            from osprey.services.channel_finder.databases.hierarchical import (
-                HierarchicalChannelDatabase,
-            )
-
-            self._database = HierarchicalChannelDatabase(db_path)
-            logger.info("ChannelFinderHierContext: database loaded from %s", db_path)
+            self._db_path = self._resolve_path(db_path)
         else:
             logger.warning(
                 "No database path configured at "
@@ -97,16 +94,23 @@ class ChannelFinderHierContext:
 
     @property
     def database(self) -> HierarchicalChannelDatabase:
-        """Get the HierarchicalChannelDatabase instance.
+        """Get the HierarchicalChannelDatabase instance (loaded on first access).
 
         Raises:
             RuntimeError: If the database is not configured.
         """
         if self._database is None:
-            raise RuntimeError(
-                "Channel finder database not configured. Check that config.yml "
-                "has channel_finder.pipelines.hierarchical.database.path set."
+            if self._db_path is None:
+                raise RuntimeError(
+                    "Channel finder database not configured. Check that config.yml "
+                    "has channel_finder.pipelines.hierarchical.database.path set."
+                )
+            from osprey.services.channel_finder.databases.hierarchical import (
+                HierarchicalChannelDatabase,
             )
+
+            self._database = HierarchicalChannelDatabase(self._db_path)
+            logger.info("ChannelFinderHierContext: database loaded from %s", self._db_path)
         return self._database
 
     @property
@@ -18,6 +18,7 @@ import os
 import time
 import uuid
 from contextlib import asynccontextmanager
+from itertools import islice
 from typing import Any
 
 from fastapi import Depends, FastAPI, HTTPException, Request, status
@@ -33,7 +34,9 @@ logger = logging.getLogger("osprey.mcp_server.dispatch_worker")
 # Configuration
 # ---------------------------------------------------------------------------
 
-DISPATCH_TIMEOUT_SEC = int(os.environ.get("DISPATCH_TIMEOUT_SEC", "300"))
+# float, not int: asyncio timeouts take floats anyway, and int() would raise
+# on a fractional override like DISPATCH_TIMEOUT_SEC=300.5 at import time.
+DISPATCH_TIMEOUT_SEC = float(os.environ.get("DISPATCH_TIMEOUT_SEC", "300"))
 _QUEUE_TTL_SEC = 60  # discard unconsumed SSE queues after this many seconds post-completion
 
 # ---------------------------------------------------------------------------
@@ -434,9 +437,10 @@ async def dispatch(request: DispatchRequest) -> DispatchResponse:
             detail=f"Tools blocked by server denylist: {denied}",
         )
 
-    # Evict oldest entries if store exceeds capacity
+    # Evict oldest entries if store exceeds capacity. islice takes the first
+    # 10% of (insertion-ordered) keys without copying the full key list.
     if len(_runs) >= _MAX_RUNS:
-        to_remove = list(_runs.keys())[: _MAX_RUNS // 10]
+        to_remove = list(islice(_runs, _MAX_RUNS // 10))
         for key in to_remove:
             del _runs[key]
             _queues.pop(key, None)
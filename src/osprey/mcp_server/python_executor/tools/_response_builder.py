@@ -52,48 +52,60 @@ async def build_execution_response(
     stdout_text = exec_result.stdout
     stderr_text = exec_result.stderr
 
-    # Auto-save figure artifacts collected by the adapter
-    for fig_path in exec_result.figures:
+    # Auto-save figure and subprocess artifacts under one deferred index
+    # write — a single execution can produce several, and each save would
+    # otherwise rewrite the full index.
+    if exec_result.figures or exec_result.artifacts:
         try:
             from osprey.stores.artifact_store import get_artifact_store
 
             store = get_artifact_store()
-            fig_entry = store.save_file(
-                file_content=fig_path.read_bytes(),
-                filename=fig_path.name,
-                artifact_type="image",
-                title=f"Figure: {fig_path.stem}",
-                description=f"Figure from: {description}",
-                mime_type=f"image/{fig_path.suffix.lstrip('.')}",
-                tool_source=tool_source,
-            )
-            artifact_ids.append(fig_entry.id)
         except Exception:
-            logger.debug("Figure artifact save failed for %s (non-fatal)", fig_path, exc_info=True)
-
-    # Auto-save artifacts collected from subprocess save_artifact() calls
-    for art in exec_result.artifacts:
-        try:
-            from osprey.stores.artifact_store import get_artifact_store
-
-            store = get_artifact_store()
-            art_entry = store.save_file(
-                file_content=art["path"].read_bytes(),
-                filename=art["path"].name,
-                artifact_type=art["artifact_type"],
-                title=art["title"],
-                description=art["description"],
-                mime_type=art["mime_type"],
-                tool_source=tool_source,
-                category=art.get("category", ""),
-            )
-            artifact_ids.append(art_entry.id)
-        except Exception:
-            logger.debug(
-                "Subprocess artifact save failed for %s (non-fatal)",
-                art.get("title", "unknown"),
-                exc_info=True,
-            )
+            store = None
+            logger.debug("Artifact store unavailable (non-fatal)", exc_info=True)
+
+        if store is not None:
+            with store.defer_saves():
+                # Figures collected by the adapter
+                for fig_path in exec_result.figures:
+                    try:
+                        fig_entry = store.save_file(
+                            file_content=fig_path.read_bytes(),
+                            filename=fig_path.name,
+                            artifact_type="image",
+                            title=f"Figure: {fig_path.stem}",
+                            description=f"Figure from: {description}",
+                            mime_type=f"image/{fig_path.suffix.lstrip('.')}",
+                            tool_source=tool_source,
+                        )
+                        artifact_ids.append(fig_entry.id)
+                    except Exception:
+                        logger.debug(
+                            "Figure artifact save failed for %s (non-fatal)",
+                            fig_path,
+                            exc_info=True,
+                        )
+
+                # Artifacts collected from subprocess save_artifact() calls
+                for art in exec_result.artifacts:
+                    try:
+                        art_entry = store.save_file(
+                            file_content=art["path"].read_bytes(),
+                            filename=art["path"].name,
+                            artifact_type=art["artifact_type"],
+                            title=art["title"],
+                            description=art["description"],
+                            mime_type=art["mime_type"],
+                            tool_source=tool_source,
+                            category=art.get("category", ""),
+                        )
+                        artifact_ids.append(art_entry.id)
+                    except Exception:
+                        logger.debug(
+                            "Subprocess artifact save failed for %s (non-fatal)",
+                            art.get("title", "unknown"),
+                            exc_info=True,
+                        )
 
     has_errors = not exec_result.success
     full_result = {
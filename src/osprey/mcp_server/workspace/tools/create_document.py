@@ -146,36 +146,39 @@ async def create_document(
         store = get_artifact_store()
         output_artifact_ids: list[str] = []
 
-        # Save PDF
-        pdf_entry = store.save_file(
-            file_content=pdf_path.read_bytes(),
-            filename=f"{title[:40].replace(' ', '_')}.pdf",
-            artifact_type="file",
-            title=title,
-            description=description or f"PDF document: {title}",
-            mime_type="application/pdf",
-            tool_source="create_document",
-            metadata={"figures_included": len(resolved_files)},
-        )
-        store.update_entry_metadata(
-            pdf_entry.id, category="document", source_agent="data-visualizer"
-        )
-        output_artifact_ids.append(pdf_entry.id)
-
-        # Save .tex source
-        tex_entry = store.save_file(
-            file_content=latex_source.encode("utf-8"),
-            filename=f"{title[:40].replace(' ', '_')}.tex",
-            artifact_type="text",
-            title=f"Source: {title}",
-            description=f"LaTeX source for: {title}",
-            mime_type="application/x-tex",
-            tool_source="create_document",
-        )
-        store.update_entry_metadata(
-            tex_entry.id, category="document", source_agent="data-visualizer"
-        )
-        output_artifact_ids.append(tex_entry.id)
+        # Two saves plus two metadata updates would rewrite the index four
+        # times; coalesce them into a single write.
+        with store.defer_saves():
+            # Save PDF
+            pdf_entry = store.save_file(
+                file_content=pdf_path.read_bytes(),
+                filename=f"{title[:40].replace(' ', '_')}.pdf",
+                artifact_type="file",
+                title=title,
+                description=description or f"PDF document: {title}",
+                mime_type="application/pdf",
+                tool_source="create_document",
+                metadata={"figures_included": len(resolved_files)},
+            )
+            store.update_entry_metadata(
+                pdf_entry.id, category="document", source_agent="data-visualizer"
+            )
+            output_artifact_ids.append(pdf_entry.id)
+
+            # Save .tex source
+            tex_entry = store.save_file(
+                file_content=latex_source.encode("utf-8"),
+                filename=f"{title[:40].replace(' ', '_')}.tex",
+                artifact_type="text",
+                title=f"Source: {title}",
+                description=f"LaTeX source for: {title}",
+                mime_type="application/x-tex",
+                tool_source="create_document",
+            )
+            store.update_entry_metadata(
+                tex_entry.id, category="document", source_agent="data-visualizer"
+            )
+            output_artifact_ids.append(tex_entry.id)
 
     response: dict = {
         "status": "success",
@@ -21,6 +21,11 @@ OSPREY_MCP_PREFIXES = (
     "mcp__channel-finder__",
 )
 
+# Derived server-name set for O(1) dispatch in _match_osprey_prefix. Every
+# prefix has the shape ``mcp__<server>__``, so one split + set membership
+# replaces a startswith scan over all prefixes per tool event.
+_OSPREY_MCP_SERVERS = frozenset(p.split("__")[1] for p in OSPREY_MCP_PREFIXES)
+
 MAX_RESULT_LENGTH = 500
 MAX_ERROR_RESULT_LENGTH = 2000
 MAX_CHAT_MESSAGE_LENGTH = 2000
@@ -60,12 +65,9 @@ def _match_osprey_prefix(tool_name: str) -> tuple[str, str, str] | None:
 
     Returns (short_name, server, full_name) or None if no match.
     """
-    for prefix in OSPREY_MCP_PREFIXES:
-        if tool_name.startswith(prefix):
-            short_name = tool_name[len(prefix) :]
-            parts = tool_name.split("__")
-            server = parts[1] if len(parts) >= 3 else "unknown"
-            return short_name, server, tool_name
+    parts = tool_name.split("__", 2)
+    if len(parts) == 3 and parts[0] == "mcp" and parts[1] in _OSPREY_MCP_SERVERS:
+        return parts[2], parts[1], tool_name
     return None
 
 
@@ -111,6 +111,20 @@ def set_api_call_context(
     _api_call_context.set(context)
 
 
+# Patterns to skip while walking the stack (framework internals that aren't
+# the real caller). Module-level so the list is not re-allocated on every
+# API call — _get_caller_info runs once per chat completion.
+_CALLER_SKIP_PATTERNS = (
+    "/logging.py",  # This file!
+    "/completion.py",  # The get_chat_completion wrapper
+    "/concurrent/futures/",  # Thread/process pool executors
+    "/threading.py",  # Threading module
+    "/asyncio/",  # AsyncIO internals
+    "/litellm/",  # LiteLLM adapter
+    "/queue.py",  # Queue module
+)
+
+
 def _get_caller_info(skip_frames: int = 2) -> dict[str, Any]:
     """Extract detailed information about the calling function.
 
@@ -158,18 +172,6 @@ def _get_caller_info(skip_frames: int = 2) -> dict[str, Any]:
                 "module": "Unknown",
             }
 
-        # Patterns to skip (framework internals that aren't the real caller)
-        # These are file path patterns that indicate framework/stdlib machinery
-        skip_patterns = [
-            "/logging.py",  # This file!
-            "/completion.py",  # The get_chat_completion wrapper
-            "/concurrent/futures/",  # Thread/process pool executors
-            "/threading.py",  # Threading module
-            "/asyncio/",  # AsyncIO internals
-            "/litellm/",  # LiteLLM adapter
-            "/queue.py",  # Queue module
-        ]
-
         # Start from frame 0 and find the first frame that's meaningful
         caller_frame = None
         threading_context = None
@@ -183,7 +185,7 @@ def _get_caller_info(skip_frames: int = 2) -> dict[str, Any]:
                 continue
 
             # Check if this is internal framework machinery
-            is_internal = any(pattern in candidate_file for pattern in skip_patterns)
+            is_internal = any(pattern in candidate_file for pattern in _CALLER_SKIP_PATTERNS)
 
             if is_internal:
                 # Track what we're skipping for debugging
@@ -24,6 +24,15 @@ from .litellm_adapter import check_litellm_health, execute_litellm_completion
 
 logger = get_logger("argo")
 
+# Compiled once at import: _clean_json_response runs on every structured-output
+# response, and string-literal re.sub/re.search calls pay a pattern-cache
+# lookup per call.
+_COLON_TRUE_RE = re.compile(r":\s*True\b")
+_COLON_FALSE_RE = re.compile(r":\s*False\b")
+_COMMA_TRUE_RE = re.compile(r",\s*True\b")
+_COMMA_FALSE_RE = re.compile(r",\s*False\b")
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 
 def _clean_json_response(text: str) -> str:
     """Clean markdown code blocks and fix common JSON issues from Argo response."""
@@ -39,15 +48,15 @@ def _clean_json_response(text: str) -> str:
     text = text.strip()
 
     # Fix Python-style booleans (True/False → true/false)
-    text = re.sub(r":\s*True\b", ": true", text)
-    text = re.sub(r":\s*False\b", ": false", text)
-    text = re.sub(r",\s*True\b", ", true", text)
-    text = re.sub(r",\s*False\b", ", false", text)
+    text = _COLON_TRUE_RE.sub(": true", text)
+    text = _COLON_FALSE_RE.sub(": false", text)
+    text = _COMMA_TRUE_RE.sub(", true", text)
+    text = _COMMA_FALSE_RE.sub(", false", text)
 
     # If response contains text before JSON, extract the JSON object
     if not text.startswith("{") and not text.startswith("["):
         # Try to find a JSON object in the response
-        match = re.search(r"\{.*\}", text, re.DOTALL)
+        match = _JSON_OBJECT_RE.search(text)
         if match:
             text = match.group(0)
 
@@ -28,6 +28,7 @@ Limits Validation:
 
 import asyncio
 import atexit
+import threading
 from typing import TYPE_CHECKING, Any
 
 from osprey.utils.logger import get_logger
@@ -130,23 +131,41 @@ async def _write_channels_async(channel_values: dict[str, Any], **kwargs) -> Non
                 )
 
 
+# Persistent background event loop shared by all synchronous runtime calls.
+# Generated code typically issues many sequential read/write calls; spinning
+# up (and tearing down) a fresh loop — or a whole thread pool in notebook
+# contexts — per call is measurable overhead and also means the cached
+# connector hops between loops. One daemon-thread loop serves every call and
+# keeps the connector bound to a single loop for its whole lifetime.
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared background event loop (created once)."""
+    global _background_loop
+
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="osprey-runtime-loop", daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+
+    return _background_loop
+
+
 def _run_async(coro) -> Any:
     """Run async coroutine synchronously.
 
-    Handles both subprocess and Jupyter notebook contexts correctly.
+    Submits to the shared background loop, which works from both subprocess
+    contexts (no running loop) and Jupyter notebook contexts (running loop in
+    the calling thread) without per-call loop churn.
     """
-    try:
-        # Try to get running loop (e.g., in Jupyter with nest_asyncio)
-        asyncio.get_running_loop()
-        # If we have a running loop, we need to run in a new thread
-        import concurrent.futures
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
-    except RuntimeError:
-        # No running loop - we're in a subprocess, use asyncio.run()
-        return asyncio.run(coro)
+    future = asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
+    return future.result()
 
 
 # ========================================================
@@ -264,7 +283,15 @@ async def cleanup_runtime() -> None:
 # Register cleanup on module exit
 def _cleanup_on_exit() -> None:
     """Synchronous cleanup for atexit handler."""
-    if _runtime_connector is not None:
+    loop = _background_loop
+    if loop is not None and not loop.is_closed():
+        if _runtime_connector is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(cleanup_runtime(), loop).result(timeout=5)
+            except Exception:
+                pass  # Best effort cleanup
+        loop.call_soon_threadsafe(loop.stop)
+    elif _runtime_connector is not None:
         try:
             asyncio.run(cleanup_runtime())
         except Exception:
@@ -481,15 +481,17 @@ async def run_enhance(
         if progress:
             progress(f"Processing {len(entries)} entries...")
 
+        # Collect successes per module and mark them in one batched UPDATE at
+        # the end instead of one round-trip per (entry, module). Failures are
+        # still marked individually — they carry per-entry error messages.
+        completed: dict[str, list[str]] = {e.name: [] for e in enhancers}
+
         async with service.pool.connection() as conn:
             for i, entry in enumerate(entries):
                 for enhancer in enhancers:
                     try:
                         await enhancer.enhance(entry, conn)
-                        await service.repository.mark_enhancement_complete(
-                            entry["entry_id"],
-                            enhancer.name,
-                        )
+                        completed[enhancer.name].append(entry["entry_id"])
                     except Exception as e:
                         await service.repository.mark_enhancement_failed(
                             entry["entry_id"],
@@ -500,6 +502,9 @@ async def run_enhance(
                 if (i + 1) % 10 == 0 and progress:
                     progress(f"  Processed {i + 1} entries...")
 
+        for module_name, entry_ids in completed.items():
+            await service.repository.mark_enhancements_complete(entry_ids, module_name)
+
     return EnhanceResult(entries_processed=len(entries), module_names=module_names)
 
 
@@ -803,7 +808,9 @@ async def run_quickstart(
             if enhancers and progress:
                 progress(f"  Enhancement modules: {[e.name for e in enhancers]}")
 
-            service = await create_ariel_service(config)
+            # Reuse the migration pool — opening a second one would redo the
+            # TCP/auth handshakes against the same database.
+            service = await create_ariel_service(config, pool=pool)
             async with service:
                 async with service.pool.connection() as conn:
                     async for entry in adapter_instance.fetch_entries():
@@ -952,10 +959,13 @@ async def seed_logbook_entries(
     async with service:
         run_id = await service.repository.start_ingestion_run("Simulation")
         try:
-            for entry in entries:
-                await service.repository.upsert_entry(entry)
-                count += 1
-                if count % 100 == 0 and progress:
+            # Batched upsert — one executemany per chunk instead of one
+            # round-trip per entry.
+            for start in range(0, len(entries), 500):
+                chunk = entries[start : start + 500]
+                await service.repository.upsert_entries(chunk)
+                count += len(chunk)
+                if progress and count < len(entries):
                     progress(f"  Seeded {count} entries...")
             await service.repository.complete_ingestion_run(
                 run_id, entries_added=count, entries_updated=0, entries_failed=0
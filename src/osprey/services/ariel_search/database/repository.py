@@ -141,16 +141,7 @@ class ARIELRepository:
                 query=f"SELECT entry_ids=ANY([{len(entry_ids)} ids])",
             ) from e
 
-    async def upsert_entry(self, entry: EnhancedLogbookEntry) -> None:
-        """Insert or update an entry.
-
-        Args:
-            entry: The entry to upsert
-        """
-        try:
-            async with self.pool.connection() as conn:
-                await conn.execute(
-                    """
+    _UPSERT_ENTRY_SQL = """
                     INSERT INTO enhanced_entries (
                         entry_id, source_system, timestamp, author, raw_text,
                         attachments, metadata, enhancement_status
@@ -176,24 +167,63 @@ class ARIELRepository:
                             ELSE EXCLUDED.attachments
                         END,
                         metadata = EXCLUDED.metadata
-                    """,
-                    [
-                        entry["entry_id"],
-                        entry["source_system"],
-                        entry["timestamp"],
-                        entry.get("author", ""),
-                        entry["raw_text"],
-                        json.dumps(entry.get("attachments", [])),
-                        json.dumps(entry.get("metadata", {})),
-                        json.dumps(entry.get("enhancement_status", {})),
-                    ],
-                )
+                    """
+
+    @staticmethod
+    def _upsert_entry_params(entry: EnhancedLogbookEntry) -> list:
+        """Build the parameter list for :data:`_UPSERT_ENTRY_SQL`."""
+        return [
+            entry["entry_id"],
+            entry["source_system"],
+            entry["timestamp"],
+            entry.get("author", ""),
+            entry["raw_text"],
+            json.dumps(entry.get("attachments", [])),
+            json.dumps(entry.get("metadata", {})),
+            json.dumps(entry.get("enhancement_status", {})),
+        ]
+
+    async def upsert_entry(self, entry: EnhancedLogbookEntry) -> None:
+        """Insert or update an entry.
+
+        Args:
+            entry: The entry to upsert
+        """
+        try:
+            async with self.pool.connection() as conn:
+                await conn.execute(self._UPSERT_ENTRY_SQL, self._upsert_entry_params(entry))
         except Exception as e:
             raise DatabaseQueryError(
                 f"Failed to upsert entry {entry['entry_id']}: {e}",
                 query=f"UPSERT entry_id={entry['entry_id']}",
             ) from e
 
+    async def upsert_entries(self, entries: list[EnhancedLogbookEntry]) -> None:
+        """Insert or update many entries in one batched statement.
+
+        Bulk paths (seeding, re-ingestion) calling :meth:`upsert_entry` in a
+        loop pay one pool checkout and one round-trip per row; this issues a
+        single ``executemany`` over one connection instead.
+
+        Args:
+            entries: The entries to upsert
+        """
+        if not entries:
+            return
+
+        try:
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.executemany(
+                        self._UPSERT_ENTRY_SQL,
+                        [self._upsert_entry_params(e) for e in entries],
+                    )
+        except Exception as e:
+            raise DatabaseQueryError(
+                f"Failed to upsert batch of {len(entries)} entries: {e}",
+                query=f"UPSERT batch of {len(entries)} entries",
+            ) from e
+
     async def search_by_time_range(
         self,
         start: datetime | None = None,
@@ -594,6 +624,41 @@ class ARIELRepository:
                 query=f"UPDATE entry_id={entry_id} module={module_name}",
             ) from e
 
+    async def mark_enhancements_complete(self, entry_ids: list[str], module_name: str) -> None:
+        """Mark an enhancement as complete for many entries in one round-trip.
+
+        Batched form of :meth:`mark_enhancement_complete` — issues a single
+        ``UPDATE ... WHERE entry_id = ANY(...)`` instead of one statement per
+        entry, which matters for remote databases where each round-trip pays
+        network latency.
+
+        Args:
+            entry_ids: The entry IDs to mark
+            module_name: The enhancement module name
+        """
+        if not entry_ids:
+            return
+
+        try:
+            async with self.pool.connection() as conn:
+                await conn.execute(
+                    """
+                    UPDATE enhanced_entries
+                    SET enhancement_status = jsonb_set(
+                        enhancement_status,
+                        %s,
+                        jsonb_build_object('status', 'complete', 'completed_at', NOW()::text)
+                    )
+                    WHERE entry_id = ANY(%s)
+                    """,
+                    [[module_name], entry_ids],
+                )
+        except Exception as e:
+            raise DatabaseQueryError(
+                f"Failed to mark enhancements complete: {e}",
+                query=f"UPDATE entry_ids=ANY([{len(entry_ids)} ids]) module={module_name}",
+            ) from e
+
     async def mark_enhancement_failed(
         self,
         entry_id: str,
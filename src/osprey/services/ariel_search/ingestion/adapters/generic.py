@@ -31,7 +31,9 @@ class GenericJSONAdapter(FacilityAdapter):
     """Generic JSON ingestion adapter.
 
     Reads entries from JSON files or HTTP endpoints with a flexible schema.
-    Supports writing to local JSON files.
+    Supports writing to local JSON files. Local ``.jsonl`` sources (one entry
+    per line) are also supported and make writes append-only instead of
+    rewriting the whole file per entry.
     """
 
     def __init__(self, config: "ARIELConfig") -> None:
@@ -77,11 +79,10 @@ class GenericJSONAdapter(FacilityAdapter):
         Yields:
             EnhancedLogbookEntry objects
         """
-        data = await self._load_data()
-        entries = data.get("entries", [])
-
         count = 0
-        for entry_data in entries:
+        failed = 0
+        first_error: Exception | None = None
+        async for entry_data in self._iter_raw_entries():
             try:
                 entry = self._convert_entry(entry_data)
 
@@ -97,9 +98,19 @@ class GenericJSONAdapter(FacilityAdapter):
                     break
 
             except Exception as e:
-                logger.warning(f"Failed to convert entry: {e}")
+                # One warning per bad entry floods the log on a corrupt
+                # archive; log details at debug and summarize once below.
+                failed += 1
+                if first_error is None:
+                    first_error = e
+                logger.debug(f"Failed to convert entry: {e}")
                 continue
 
+        if failed:
+            logger.warning(
+                f"Skipped {failed} entries that failed conversion (first: {first_error})"
+            )
+
     async def create_entry(self, request: "FacilityEntryCreateRequest") -> str:
         """Create an entry in the local JSON file.
 
@@ -141,7 +152,11 @@ class GenericJSONAdapter(FacilityAdapter):
         return entry_id
 
     def _append_entry(self, entry_data: dict[str, Any]) -> None:
-        """Append an entry to the local JSON file with file locking.
+        """Append an entry to the local JSON/JSONL file with file locking.
+
+        For ``.jsonl`` sources this is a true append — one O(entry) write —
+        instead of the read-all/rewrite-all cycle the ``.json`` envelope format
+        requires, which grows O(total file size) per created entry.
 
         Args:
             entry_data: Entry dict matching the JSON schema that _convert_entry reads.
@@ -151,6 +166,21 @@ class GenericJSONAdapter(FacilityAdapter):
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if path.suffix == ".jsonl":
+            try:
+                with open(path, "a") as f:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    try:
+                        f.write(json.dumps(entry_data, default=str) + "\n")
+                    finally:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            except OSError as e:
+                raise IngestionError(
+                    f"Failed to append entry to {self.source_url}: {e}",
+                    source_system=self.source_system_name,
+                ) from e
+            return
+
         tmp_path = path.with_suffix(".tmp")
 
         try:
@@ -187,6 +217,33 @@ class GenericJSONAdapter(FacilityAdapter):
                 source_system=self.source_system_name,
             ) from e
 
+    async def _iter_raw_entries(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield raw entry dicts one at a time.
+
+        Local ``.jsonl`` sources stream line by line, so peak memory stays
+        O(one entry) instead of O(whole archive) — loading everything up
+        front roughly doubles peak RSS (text buffer plus parsed tree) on
+        large exports. ``.json`` envelopes and HTTP sources still load in
+        full; their format requires the complete document.
+        """
+        path = Path(self.source_url)
+        if not self.source_url.startswith(("http://", "https://")) and path.suffix == ".jsonl":
+            if not path.exists():
+                raise IngestionError(
+                    f"Source file not found: {self.source_url}",
+                    source_system=self.source_system_name,
+                )
+            with open(path) as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+            return
+
+        data = await self._load_data()
+        for entry_data in data.get("entries", []):
+            yield entry_data
+
     async def _load_data(self) -> dict[str, Any]:
         """Load JSON data from source."""
         if self.source_url.startswith(("http://", "https://")):
@@ -71,6 +71,8 @@ class ORNLLogbookAdapter(FacilityAdapter):
             entries = []
 
         count = 0
+        failed = 0
+        first_error: Exception | None = None
         for entry_data in entries:
             try:
                 entry = self._convert_entry(entry_data)
@@ -92,9 +94,19 @@ class ORNLLogbookAdapter(FacilityAdapter):
                     break
 
             except Exception as e:
-                logger.warning(f"Failed to convert entry: {e}")
+                # One warning per bad entry floods the log on a corrupt
+                # export; log details at debug and summarize once below.
+                failed += 1
+                if first_error is None:
+                    first_error = e
+                logger.debug(f"Failed to convert entry: {e}")
                 continue
 
+        if failed:
+            logger.warning(
+                f"Skipped {failed} entries that failed conversion (first: {first_error})"
+            )
+
     async def _load_data(self) -> Any:
         """Load JSON data from source."""
         if self.source_url.startswith(("http://", "https://")):
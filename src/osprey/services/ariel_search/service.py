@@ -576,6 +576,7 @@ class ARIELSearchService:
 
 async def create_ariel_service(
     config: ARIELConfig,
+    pool: AsyncConnectionPool | None = None,
 ) -> ARIELSearchService:
     """Create and initialize an ARIEL search service.
 
@@ -583,6 +584,9 @@ async def create_ariel_service(
 
     Args:
         config: ARIEL configuration
+        pool: Optional already-open connection pool to reuse. Callers that
+            have just connected (e.g. for migrations) should pass it in
+            rather than paying a second round of TCP handshakes.
 
     Returns:
         Initialized ARIELSearchService
@@ -594,7 +598,8 @@ async def create_ariel_service(
     from osprey.services.ariel_search.database.connection import create_connection_pool
     from osprey.services.ariel_search.database.repository import ARIELRepository
 
-    pool = await create_connection_pool(config.database)
+    if pool is None:
+        pool = await create_connection_pool(config.database)
     repository = ARIELRepository(pool, config)
 
     return ARIELSearchService(
@@ -75,10 +75,11 @@ class ChannelDatabase(BaseDatabase):
         Returns:
             List of validation entries with 'channel' (str) and 'valid' (bool) keys
         """
-        validation_results = []
-        for name in channel_names:
-            validation_results.append({"channel": name, "valid": self.validate_channel(name)})
-        return validation_results
+        # Bind the map once: validation runs over every candidate an LLM pass
+        # proposes, and a per-name validate_channel() call costs a method plus
+        # attribute lookup each iteration for what is a set-membership test.
+        channel_map = self.channel_map
+        return [{"channel": name, "valid": name in channel_map} for name in channel_names]
 
     def get_valid_channels(self, validation_results: list[dict]) -> list[str]:
         """Extract only valid channel names from validation results."""
@@ -10,12 +10,25 @@ Supports flexible hierarchy with arbitrary mixing of:
 import itertools
 import json
 import logging
+import re
+from collections import ChainMap
 from typing import Any
 
 from ..core.base_database import BaseDatabase, DatabaseWriteError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: channel expansion runs these over every generated
+# channel name, and _clean_optional_separators alone applies six substitutions
+# per channel.
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+_MULTI_COLON_RE = re.compile(r":{2,}")
+_MULTI_DASH_RE = re.compile(r"-{2,}")
+_MULTI_UNDERSCORE_RE = re.compile(r"_{2,}")
+_TRAILING_SEP_RE = re.compile(r"[:_-]+$")
+_LEADING_SEP_RE = re.compile(r"^[_:]")
+_MIXED_SEP_RE = re.compile(r"[:_-]([:_-])+")
+
 _HIER_META_KEYS = frozenset(
     {
         "_description",
@@ -59,6 +72,10 @@ class HierarchicalChannelDatabase(BaseDatabase):
         levels_list = hierarchy_def["levels"]
         self.hierarchy_levels = [level["name"] for level in levels_list]
         self.naming_pattern = hierarchy_def["naming_pattern"]
+        # Parsed (prefix, level_name) pairs for naming_pattern, built lazily by
+        # _build_channel_with_separators — the pattern never changes after
+        # load, so it is parsed once rather than per generated channel.
+        self._pattern_parts: list[tuple[str, str]] | None = None
 
         # Build hierarchy_config from levels list
         self.hierarchy_config = {"levels": {}}
@@ -68,6 +85,10 @@ class HierarchicalChannelDatabase(BaseDatabase):
                 "optional": level_def.get("optional", False),
             }
 
+        # Level names never change after load; precompute the name -> position
+        # lookup so tree walks don't rescan hierarchy_levels per level.
+        self._level_index = {name: i for i, name in enumerate(self.hierarchy_levels)}
+
         # Validate naming_pattern references correct level names
         self._validate_naming_pattern()
 
@@ -90,10 +111,8 @@ class HierarchicalChannelDatabase(BaseDatabase):
 
         Prevents out-of-sync errors between level names and naming pattern.
         """
-        import re
-
         # Extract placeholder names from naming pattern (e.g., {system}, {family}, etc.)
-        pattern_placeholders = set(re.findall(r"\{(\w+)\}", self.naming_pattern))
+        pattern_placeholders = set(_PLACEHOLDER_RE.findall(self.naming_pattern))
         expected_placeholders = set(self.hierarchy_levels)
 
         # Pattern placeholders must be subset of hierarchy levels
@@ -431,10 +450,8 @@ class HierarchicalChannelDatabase(BaseDatabase):
             List of level names that appear as placeholders in naming_pattern,
             in the order they appear in hierarchy_levels (not pattern order).
         """
-        import re
-
         # Extract all placeholders from pattern
-        pattern_placeholders = set(re.findall(r"\{(\w+)\}", self.naming_pattern))
+        pattern_placeholders = set(_PLACEHOLDER_RE.findall(self.naming_pattern))
 
         # Return in hierarchy order (not pattern order) for consistent Cartesian product
         return [level for level in self.hierarchy_levels if level in pattern_placeholders]
@@ -457,13 +474,11 @@ class HierarchicalChannelDatabase(BaseDatabase):
                 ('device', 'signal'): '_'
             }
         """
-        import re
-
         separators = {}
         pattern = self.naming_pattern
 
         # Find all {level} placeholders and text between them
-        matches = list(re.finditer(r"\{(\w+)\}", pattern))
+        matches = list(_PLACEHOLDER_RE.finditer(pattern))
 
         for i in range(len(matches) - 1):
             current_level = matches[i].group(1)
@@ -547,11 +562,13 @@ class HierarchicalChannelDatabase(BaseDatabase):
             return True
 
         # AUTOMATIC LEAF DETECTION: Node has no children (only metadata)
-        # This eliminates the need for explicit _is_leaf on obvious leaf nodes
-        has_children = any(
-            not key.startswith("_") and isinstance(node[key], dict) for key in node.keys()
-        )
-        if not has_children:
+        # This eliminates the need for explicit _is_leaf on obvious leaf nodes.
+        # Filter the non-meta child keys once — the checks below re-use this
+        # set instead of re-scanning every key with the same predicate.
+        child_keys = [
+            key for key in node if not key.startswith("_") and isinstance(node[key], dict)
+        ]
+        if not child_keys:
             return True
 
         # All hierarchy levels processed - definitely a leaf
@@ -573,20 +590,13 @@ class HierarchicalChannelDatabase(BaseDatabase):
                 if next_config["type"] == "instances":
                     # Look for instance container matching next level name
                     has_next_level_container = any(
-                        key.upper() == next_level.upper()
-                        for key in node.keys()
-                        if isinstance(node[key], dict) and not key.startswith("_")
+                        key.upper() == next_level.upper() for key in child_keys
                     )
                     # Only a leaf if there's NO container for the next instance level
                     return not has_next_level_container
                 elif next_config["type"] == "tree":
-                    # Look for any tree children (non-meta keys)
-                    has_tree_children = any(
-                        not key.startswith("_") and isinstance(node[key], dict)
-                        for key in node.keys()
-                    )
-                    # Only a leaf if there are NO tree children
-                    return not has_tree_children
+                    # Only a leaf if there are NO tree children (non-meta keys)
+                    return not child_keys
 
         return False
 
@@ -617,22 +627,20 @@ class HierarchicalChannelDatabase(BaseDatabase):
             # Leading separator from skipped first optional
             ":SYSTEM:SIGNAL" → "SYSTEM:SIGNAL"
         """
-        import re
-
         # Multiple consecutive separators of same type
-        channel = re.sub(r":{2,}", ":", channel)  # :: → :
-        channel = re.sub(r"-{2,}", "-", channel)  # -- → -
-        channel = re.sub(r"_{2,}", "_", channel)  # __ → _
+        channel = _MULTI_COLON_RE.sub(":", channel)  # :: → :
+        channel = _MULTI_DASH_RE.sub("-", channel)  # -- → -
+        channel = _MULTI_UNDERSCORE_RE.sub("_", channel)  # __ → _
 
         # Trailing separators
-        channel = re.sub(r"[:_-]+$", "", channel)  # Remove trailing : _ -
+        channel = _TRAILING_SEP_RE.sub("", channel)  # Remove trailing : _ -
 
         # Leading separators (except intentional ones)
-        channel = re.sub(r"^[_:]", "", channel)  # Remove leading _ :
+        channel = _LEADING_SEP_RE.sub("", channel)  # Remove leading _ :
 
         # Mixed consecutive separators (e.g., ":_" when both parts empty)
         # Keep the first separator type
-        channel = re.sub(r"[:_-]([:_-])+", lambda m: m.group(0)[0], channel)
+        channel = _MIXED_SEP_RE.sub(lambda m: m.group(0)[0], channel)
 
         return channel
 
@@ -706,8 +714,6 @@ class HierarchicalChannelDatabase(BaseDatabase):
             overrides = {("signal", "suffix"): "_"}
             → "DEV-01:Mode_RB"  (uses custom _ instead of default :)
         """
-        import re
-
         pattern = self.naming_pattern
         self._get_pattern_levels()
 
@@ -715,25 +721,28 @@ class HierarchicalChannelDatabase(BaseDatabase):
         # Pattern: "S{sector}:{building}:F{floor}"
         # → [('S', 'sector'), (':', 'building'), (':F', 'floor')]
         # where each tuple is (prefix_text, level_name)
+        # Parsed once and cached — this method runs per generated channel and
+        # the pattern is fixed after load.
+        if self._pattern_parts is None:
+            matches = list(_PLACEHOLDER_RE.finditer(pattern))
+
+            # Build a list of (prefix, level_name) pairs
+            pattern_parts = []
+            for i, match in enumerate(matches):
+                level_name = match.group(1)
+
+                # Get the text before this placeholder
+                if i == 0:
+                    # First placeholder - get everything before it
+                    prefix = pattern[: match.start()]
+                else:
+                    # Get text between previous placeholder end and this one's start
+                    prefix = pattern[matches[i - 1].end() : match.start()]
 
-        # Find all placeholders and text between them
-        placeholder_pattern = r"\{(\w+)\}"
-        matches = list(re.finditer(placeholder_pattern, pattern))
-
-        # Build a list of (prefix, level_name) pairs
-        pattern_parts = []
-        for i, match in enumerate(matches):
-            level_name = match.group(1)
-
-            # Get the text before this placeholder
-            if i == 0:
-                # First placeholder - get everything before it
-                prefix = pattern[: match.start()]
-            else:
-                # Get text between previous placeholder end and this one's start
-                prefix = pattern[matches[i - 1].end() : match.start()]
+                pattern_parts.append((prefix, level_name))
+            self._pattern_parts = pattern_parts
 
-            pattern_parts.append((prefix, level_name))
+        pattern_parts = self._pattern_parts
 
         # Build the channel name
         result_parts = []
@@ -1046,12 +1055,16 @@ class HierarchicalChannelDatabase(BaseDatabase):
         pattern_levels = self._get_pattern_levels()
 
         def expand_tree(
-            path: dict[str, str],
+            path: ChainMap,
             node: dict,
             level_idx: int,
             separator_overrides: dict[tuple[str, str], str] | None = None,
         ):
-            """Recursively expand tree with flexible level handling and custom separators."""
+            """Recursively expand tree with flexible level handling and custom separators.
+
+            ``path`` is a ChainMap so each recursion step adds an O(1) child
+            view instead of copying the accumulated dict per child node.
+            """
             if separator_overrides is None:
                 separator_overrides = {}
 
@@ -1080,7 +1093,7 @@ class HierarchicalChannelDatabase(BaseDatabase):
             if self._is_leaf_node(node, level_idx):
                 # Build channel from path with custom separators
                 # First ensure all pattern levels have values (empty string for skipped optional)
-                complete_path = path.copy()
+                complete_path = dict(path)
                 for level in pattern_levels:
                     if level not in complete_path:
                         complete_path[level] = ""
@@ -1089,18 +1102,21 @@ class HierarchicalChannelDatabase(BaseDatabase):
                 channel_name = self._build_channel_with_separators(complete_path, local_overrides)
 
                 # Store channel
-                channels[channel_name] = {"channel": channel_name, "path": path.copy()}
+                channels[channel_name] = {"channel": channel_name, "path": dict(path)}
 
                 # Process children of leaf nodes to handle optional levels
                 # A node can be both a complete channel AND have children for optional suffixes
                 # Example: SIGNAL-Y is a valid channel, but may also have RB/SP suffix variants
                 if level_idx < len(self.hierarchy_levels):
-                    # Check if node has children (non-meta keys)
-                    has_children = any(
-                        not k.startswith("_") and isinstance(v, dict) for k, v in node.items()
-                    )
-
-                    if has_children:
+                    # Non-meta children, filtered once — the leaf check and
+                    # the recursion below need the same view.
+                    children = {
+                        k: v
+                        for k, v in node.items()
+                        if not k.startswith("_") and isinstance(v, dict)
+                    }
+
+                    if children:
                         # Find next tree level after current position
                         next_tree_level_idx = None
                         for idx in range(level_idx, len(self.hierarchy_levels)):
@@ -1114,17 +1130,11 @@ class HierarchicalChannelDatabase(BaseDatabase):
                         if next_tree_level_idx is not None:
                             # Process children as nodes at the next tree level
                             next_level = self.hierarchy_levels[next_tree_level_idx]
-                            children = {
-                                k: v
-                                for k, v in node.items()
-                                if not k.startswith("_") and isinstance(v, dict)
-                            }
-
                             for child_key, child_node in children.items():
                                 channel_part = self._get_channel_part(child_node, child_key)
                                 # Assign child to next tree level
                                 expand_tree(
-                                    {**path, next_level: channel_part},
+                                    path.new_child({next_level: channel_part}),
                                     child_node,
                                     next_tree_level_idx + 1,
                                     local_overrides,
@@ -1166,7 +1176,7 @@ class HierarchicalChannelDatabase(BaseDatabase):
                         for instance_name in instances:
                             # Assign instance to current level and recurse
                             expand_tree(
-                                {**path, current_level: instance_name},
+                                path.new_child({current_level: instance_name}),
                                 child_node,
                                 level_idx + 1,
                                 local_overrides,
@@ -1183,7 +1193,7 @@ class HierarchicalChannelDatabase(BaseDatabase):
                             next_level = self.hierarchy_levels[next_level_idx]
                             # Skip current optional level, assign child to next level
                             expand_tree(
-                                {**path, next_level: channel_part},
+                                path.new_child({next_level: channel_part}),
                                 child_node,
                                 next_level_idx + 1,
                                 local_overrides,
@@ -1194,7 +1204,7 @@ class HierarchicalChannelDatabase(BaseDatabase):
                     else:
                         # Normal tree expansion: assign child to current level
                         expand_tree(
-                            {**path, current_level: channel_part},
+                            path.new_child({current_level: channel_part}),
                             child_node,
                             level_idx + 1,
                             local_overrides,
@@ -1217,13 +1227,13 @@ class HierarchicalChannelDatabase(BaseDatabase):
                     instances = self._get_instance_names(expansion_def)
                     for instance_name in instances:
                         expand_tree(
-                            {**path, current_level: instance_name},
+                            path.new_child({current_level: instance_name}),
                             child_node,
                             level_idx + 1,
                             local_overrides,
                         )
 
-        expand_tree({}, self.tree, 0, {})
+        expand_tree(ChainMap(), self.tree, 0, {})
         return channels
 
     def _get_instance_names(self, expansion_def: dict) -> list[str]:
@@ -1630,11 +1640,14 @@ class HierarchicalChannelDatabase(BaseDatabase):
             DatabaseWriteError: If navigation path is invalid.
         """
         node = self.tree
+        # The _level_types property builds a fresh dict per access; bind it
+        # once rather than once per level.
+        level_types = self._level_types
         for lvl in self.hierarchy_levels:
             val = selections.get(lvl)
             if val is None:
                 break
-            ltype = self._level_types.get(lvl, "tree")
+            ltype = level_types.get(lvl, "tree")
             if ltype == "instances":
                 found = False
                 for key, child in node.items():
@@ -1882,9 +1895,8 @@ class HierarchicalChannelDatabase(BaseDatabase):
             Dict with ``expansion`` key containing the expansion config.
         """
         parent_selections = {}
-        for lvl in self.hierarchy_levels:
-            if lvl == level:
-                break
+        stop = self._level_index.get(level, len(self.hierarchy_levels))
+        for lvl in self.hierarchy_levels[:stop]:
             val = selections.get(lvl)
             if val is not None:
                 parent_selections[lvl] = val
@@ -1927,9 +1939,8 @@ class HierarchicalChannelDatabase(BaseDatabase):
             Success dict with updated expansion info.
         """
         parent_selections = {}
-        for lvl in self.hierarchy_levels:
-            if lvl == level:
-                break
+        stop = self._level_index.get(level, len(self.hierarchy_levels))
+        for lvl in self.hierarchy_levels[:stop]:
             val = selections.get(lvl)
             if val is not None:
                 parent_selections[lvl] = val
@@ -2003,10 +2014,7 @@ class HierarchicalChannelDatabase(BaseDatabase):
         if name not in parent:
             raise DatabaseWriteError(f"Node '{name}' not found", "not_found")
 
-        try:
-            lvl_idx = self.hierarchy_levels.index(level)
-        except ValueError:
-            lvl_idx = -1
+        lvl_idx = self._level_index.get(level, -1)
         remaining = self.hierarchy_levels[lvl_idx + 1 :] if lvl_idx >= 0 else self.hierarchy_levels
 
         impact = self._collect_impact(parent[name], remaining, self._level_types)
@@ -8,6 +8,7 @@ File-backed JSON with cross-process locking via fcntl.flock.
 import fcntl
 import json
 import logging
+import os
 import uuid
 from contextlib import contextmanager
 from datetime import UTC, datetime
@@ -53,6 +54,9 @@ class PendingReviewStore:
         self._path = Path(store_path)
         self._lock_file = self._path.with_suffix(".lock")
         self._data: dict[str, Any] = {"version": STORE_VERSION, "items": {}}
+        # Create the parent directory once; _save()/_locked() used to redo
+        # the mkdir (two stat syscalls) on every write.
+        self._path.parent.mkdir(parents=True, exist_ok=True)
         self._load()
 
     # ------------------------------------------------------------------
@@ -161,7 +165,6 @@ class PendingReviewStore:
 
     def _save(self) -> None:
         """Save data to file atomically (must be called within _locked context)."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self._path.with_suffix(".tmp")
         with open(tmp_path, "w") as f:
             json.dump(self._data, f, indent=2)
@@ -170,11 +173,12 @@ class PendingReviewStore:
     @contextmanager
     def _locked(self):
         """Acquire exclusive file lock for writes."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        fd = open(self._lock_file, "w")
+        # Raw fd — the lock file carries no content, so skip the buffered
+        # file-object layer.
+        fd = os.open(self._lock_file, os.O_WRONLY | os.O_CREAT, 0o644)
         try:
-            fcntl.flock(fd.fileno(), fcntl.LOCK_EX)
+            fcntl.flock(fd, fcntl.LOCK_EX)
             self._load()  # Always reload under lock
             yield
         finally:
-            fd.close()
+            os.close(fd)
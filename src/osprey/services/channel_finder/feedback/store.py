@@ -9,6 +9,7 @@ import fcntl
 import hashlib
 import json
 import logging
+import os
 import re
 import string
 from contextlib import contextmanager
@@ -59,6 +60,9 @@ class FeedbackStore:
         self._path = Path(store_path)
         self._lock_file = self._path.with_suffix(".lock")
         self._data: dict[str, Any] = {"version": STORE_VERSION, "entries": {}}
+        # Create the parent directory once; _save()/_locked() used to redo
+        # the mkdir (two stat syscalls) on every write.
+        self._path.parent.mkdir(parents=True, exist_ok=True)
         self._load()
 
     # ------------------------------------------------------------------
@@ -450,7 +454,6 @@ class FeedbackStore:
 
     def _save(self) -> None:
         """Save data to file atomically (must be called within _locked context)."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self._path.with_suffix(".tmp")
         with open(tmp_path, "w") as f:
             json.dump(self._data, f, indent=2)
@@ -459,14 +462,15 @@ class FeedbackStore:
     @contextmanager
     def _locked(self):
         """Acquire exclusive file lock for writes."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        fd = open(self._lock_file, "w")
+        # Raw fd — the lock file carries no content, so skip the buffered
+        # file-object layer.
+        fd = os.open(self._lock_file, os.O_WRONLY | os.O_CREAT, 0o644)
         try:
-            fcntl.flock(fd.fileno(), fcntl.LOCK_EX)
+            fcntl.flock(fd, fcntl.LOCK_EX)
             self._load()  # Always reload under lock
             yield
         finally:
-            fd.close()
+            os.close(fd)
 
 
 def _flatten_selections(selections: dict[str, Any]) -> dict[str, Any]:
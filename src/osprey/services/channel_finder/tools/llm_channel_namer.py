@@ -114,11 +114,12 @@ class LLMChannelNamer:
             f"INPUT CHANNELS (generate EXACTLY {len(channels)} names in order):\n"
         )
 
+        parts = [prompt]
         for i, ch in enumerate(channels, 1):
-            prompt += f'\n{i}. Short: "{ch["short_name"]}"\n'
-            prompt += f'   Description: "{ch["description"]}"\n'
+            parts.append(f'\n{i}. Short: "{ch["short_name"]}"\n')
+            parts.append(f'   Description: "{ch["description"]}"\n')
 
-        return prompt
+        return "".join(parts)
 
     def generate_names_batch(self, channels: list[dict]) -> list[str]:
         """Generate names for a batch of channels using LLM with structured output.
@@ -204,20 +205,20 @@ class LLMChannelNamer:
             "[SetPoint/ReadBack]\n\n"
         )
         total_channels = sum(len(channels) for channels in duplicate_groups.values())
-        prompt += f"GENERATE EXACTLY {total_channels} UNIQUE NAMES:\n\n"
+        parts = [prompt, f"GENERATE EXACTLY {total_channels} UNIQUE NAMES:\n\n"]
 
         channel_num = 1
         for dup_name, channels in duplicate_groups.items():
-            prompt += (
+            parts.append(
                 f"=== DUPLICATE GROUP: '{dup_name}' (needs {len(channels)} distinct names) ===\n"
             )
             for ch in channels:
-                prompt += f'{channel_num}. Short: "{ch["short_name"]}"\n'
-                prompt += f'   Description: "{ch["description"]}"\n'
-                prompt += f'   Previous Name (TOO GENERIC): "{ch["original_name"]}"\n\n'
+                parts.append(f'{channel_num}. Short: "{ch["short_name"]}"\n')
+                parts.append(f'   Description: "{ch["description"]}"\n')
+                parts.append(f'   Previous Name (TOO GENERIC): "{ch["original_name"]}"\n\n')
                 channel_num += 1
 
-        return prompt
+        return "".join(parts)
 
     def resolve_duplicates(self, channels: list[dict], names: list[str]) -> list[str]:
         """Check for duplicate names and regenerate them with more specificity.
@@ -34,6 +34,9 @@ class MachineStateReader:
     def __init__(self, channels_path: str, connector: ControlSystemConnector) -> None:
         self._channels_path = channels_path
         self._connector = connector
+        # (mtime, channel_defs, warnings) from the last parse — read() is
+        # called per snapshot and the definitions file rarely changes.
+        self._defs_cache: tuple[float, dict[str, ChannelDefinition], list[str]] | None = None
 
     @classmethod
     def from_config(cls, connector: ControlSystemConnector) -> "MachineStateReader | None":
@@ -159,6 +162,10 @@ class MachineStateReader:
         if not path.exists():
             raise FileNotFoundError(f"Channel definitions file not found: {self._channels_path}")
 
+        mtime = path.stat().st_mtime
+        if self._defs_cache is not None and self._defs_cache[0] == mtime:
+            return self._defs_cache[1], self._defs_cache[2]
+
         with open(path) as f:
             raw: Any = json.load(f)
 
@@ -187,6 +194,7 @@ class MachineStateReader:
             )
 
         logger.info(f"Loaded {len(channel_defs)} channel definitions from {self._channels_path}")
+        self._defs_cache = (mtime, channel_defs, warnings)
         return channel_defs, warnings
 
 
@@ -28,7 +28,10 @@ _DANGEROUS_PATTERNS = [
     ("os.system", "System command execution"),
 ]
 
-_PROHIBITED_IMPORTS = ["subprocess", "os.system", "eval", "exec"]
+_PROHIBITED_IMPORTS = frozenset({"subprocess", "os.system", "eval", "exec"})
+
+# Patterns that warrant a warning rather than a hard "security risk" label
+_WARNING_ONLY_PATTERNS = frozenset({"open(", "subprocess"})
 
 
 def check_security(code: str) -> list[str]:
@@ -36,7 +39,7 @@ def check_security(code: str) -> list[str]:
     issues = []
     for pattern, warning in _DANGEROUS_PATTERNS:
         if pattern in code:
-            if pattern in ["open(", "subprocess"]:
+            if pattern in _WARNING_ONLY_PATTERNS:
                 issues.append(f"Warning: {warning}")
             else:
                 issues.append(f"Security risk: {warning}")
@@ -200,68 +200,10 @@ def make_json_serializable(obj: Any) -> Any:
         >>> serializable = make_json_serializable(fig)
         >>> print(serializable['_type'])  # 'matplotlib_figure'
     """
-    from datetime import datetime
-    from pathlib import Path
-
-    def enhanced_json_serializer(obj):
-        """Enhanced serializer supporting scientific computing objects."""
-        # Handle datetime objects
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-
-        # Handle numpy arrays first (they also have 'item' method)
-        elif hasattr(obj, "tolist"):
-            try:
-                return obj.tolist()
-            except (ValueError, AttributeError):
-                # Fallback for objects that have tolist but it fails
-                pass
-
-        # Handle numpy scalars (single-element arrays)
-        elif hasattr(obj, "item"):
-            try:
-                return obj.item()
-            except ValueError:
-                # Multi-element arrays will fail here, should have been caught above
-                pass
-
-        # Handle matplotlib figures
-        elif _is_matplotlib_figure(obj):
-            return _serialize_matplotlib_figure(obj)
-
-        # Handle pandas DataFrames and Series
-        elif hasattr(obj, "to_dict") and hasattr(obj, "index"):
-            return obj.to_dict()
-
-        # Handle pathlib objects
-        elif isinstance(obj, Path):
-            return str(obj)
-
-        # Handle sets and frozensets
-        elif isinstance(obj, (set, frozenset)):
-            return {"items": list(obj), "_type": type(obj).__name__}
-
-        # Handle complex numbers
-        elif isinstance(obj, complex):
-            return {"real": obj.real, "imag": obj.imag, "_type": "complex"}
-
-        # Handle custom objects with to_dict method
-        elif hasattr(obj, "to_dict") and callable(obj.to_dict):
-            return obj.to_dict()
-
-        # Default to string representation with type info
-        else:
-            return {
-                "value": str(obj),
-                "type": type(obj).__name__,
-                "module": getattr(type(obj), "__module__", "unknown"),
-                "_serialization_note": "converted_to_string",
-            }
-
     # Use json.loads(json.dumps()) to leverage Python's built-in serialization
     # This is more efficient and handles nested structures automatically
     try:
-        return json.loads(json.dumps(obj, default=enhanced_json_serializer, ensure_ascii=False))
+        return json.loads(json.dumps(obj, default=_enhanced_json_serializer, ensure_ascii=False))
     except (TypeError, ValueError) as e:
         # If JSON serialization completely fails, return a structured fallback
         return {
@@ -272,6 +214,70 @@ def make_json_serializable(obj: Any) -> Any:
         }
 
 
+def _enhanced_json_serializer(obj):
+    """Enhanced ``json.dump(default=...)`` handler for scientific computing objects.
+
+    Shared by :func:`make_json_serializable` and the direct-to-file writers so
+    datetime/numpy/pandas conversion happens inside the encoder rather than via
+    a per-object copy pass beforehand.
+    """
+    from datetime import datetime
+    from pathlib import Path
+
+    # Handle datetime objects
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+
+    # Handle numpy arrays first (they also have 'item' method)
+    elif hasattr(obj, "tolist"):
+        try:
+            return obj.tolist()
+        except (ValueError, AttributeError):
+            # Fallback for objects that have tolist but it fails
+            pass
+
+    # Handle numpy scalars (single-element arrays)
+    elif hasattr(obj, "item"):
+        try:
+            return obj.item()
+        except ValueError:
+            # Multi-element arrays will fail here, should have been caught above
+            pass
+
+    # Handle matplotlib figures
+    elif _is_matplotlib_figure(obj):
+        return _serialize_matplotlib_figure(obj)
+
+    # Handle pandas DataFrames and Series
+    elif hasattr(obj, "to_dict") and hasattr(obj, "index"):
+        return obj.to_dict()
+
+    # Handle pathlib objects
+    elif isinstance(obj, Path):
+        return str(obj)
+
+    # Handle sets and frozensets
+    elif isinstance(obj, (set, frozenset)):
+        return {"items": list(obj), "_type": type(obj).__name__}
+
+    # Handle complex numbers
+    elif isinstance(obj, complex):
+        return {"real": obj.real, "imag": obj.imag, "_type": "complex"}
+
+    # Handle custom objects with to_dict method
+    elif hasattr(obj, "to_dict") and callable(obj.to_dict):
+        return obj.to_dict()
+
+    # Default to string representation with type info
+    else:
+        return {
+            "value": str(obj),
+            "type": type(obj).__name__,
+            "module": getattr(type(obj), "__module__", "unknown"),
+            "_serialization_note": "converted_to_string",
+        }
+
+
 def _is_matplotlib_figure(obj) -> bool:
     """Check if object is a matplotlib figure."""
     return hasattr(obj, "savefig") and hasattr(obj, "get_axes") and type(obj).__name__ == "Figure"
@@ -356,12 +362,11 @@ def serialize_results_to_file(results: Any, file_path: str) -> dict:
     }
 
     try:
-        # Convert to JSON-serializable format
-        serializable_results = make_json_serializable(results)
-
-        # Save to file
+        # Serialize straight to the file with the enhanced default= handler —
+        # no intermediate make_json_serializable() pass, which would serialize
+        # once, reparse the whole payload, and serialize again.
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(serializable_results, f, indent=2, ensure_ascii=False)
+            json.dump(results, f, default=_enhanced_json_serializer, indent=2, ensure_ascii=False)
 
         metadata["success"] = True
         return metadata
@@ -419,14 +424,19 @@ async def serialize_results_to_file_async(results: Any, file_path: str) -> dict:
     }
 
     try:
-        # Convert to JSON-serializable format (CPU-bound, use to_thread)
-        serializable_results = await asyncio.to_thread(make_json_serializable, results)
+        # Serialize once with the enhanced default= handler (CPU-bound, use
+        # to_thread) — skips the serialize/reparse/serialize round-trip of
+        # going through make_json_serializable() first.
+        json_str = await asyncio.to_thread(
+            json.dumps,
+            results,
+            default=_enhanced_json_serializer,
+            indent=2,
+            ensure_ascii=False,
+        )
 
         # Save to file asynchronously
         async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-            json_str = await asyncio.to_thread(
-                json.dumps, serializable_results, indent=2, ensure_ascii=False
-            )
             await f.write(json_str)
 
         metadata["success"] = True
@@ -17,6 +17,7 @@ import json
 import logging
 import mimetypes
 import os
+import re
 import uuid
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
@@ -28,6 +29,11 @@ from osprey.stores.base_store import BaseStore, _sanitize_for_json
 
 logger = logging.getLogger("osprey.stores.artifact_store")
 
+# Characters dropped from slugs: anything outside word chars, spaces and
+# hyphens (\w covers alphanumerics plus underscore). Compiled once so each
+# save pays a single C-level pass instead of a per-character Python loop.
+_SLUG_STRIP_RE = re.compile(r"[^\w -]")
+
 
 def register_artifact_listener(fn: Callable[[ArtifactEntry], None]) -> None:
     """Register a callback invoked after every artifact save."""
@@ -170,9 +176,7 @@ def _serialize_object(obj: Any, title: str) -> tuple[bytes, str, str, str]:
 
 def _slugify(title: str) -> str:
     """Convert title to a filesystem-safe slug."""
-    slug = title.lower().strip()
-    slug = "".join(c if c.isalnum() or c in (" ", "-", "_") else "" for c in slug)
-    slug = slug.replace(" ", "_")
+    slug = _SLUG_STRIP_RE.sub("", title.lower().strip()).replace(" ", "_")
     return slug[:60] or "artifact"
 
 
@@ -269,6 +273,7 @@ class ArtifactStore(BaseStore[ArtifactEntry]):
                 session_id=os.environ.get("OSPREY_SESSION_ID", ""),
             )
             self._entries.append(entry)
+            self._entries_by_id[entry.id] = entry
             self._save_index()
 
         self._notify_listeners(entry)
@@ -403,6 +408,7 @@ class ArtifactStore(BaseStore[ArtifactEntry]):
                 session_id=os.environ.get("OSPREY_SESSION_ID", ""),
             )
             self._entries.append(entry)
+            self._entries_by_id[entry.id] = entry
             self._save_index()
 
         self._notify_listeners(entry)
@@ -452,19 +458,26 @@ class ArtifactStore(BaseStore[ArtifactEntry]):
     def set_pinned(self, artifact_id: str, pinned: bool = True) -> ArtifactEntry | None:
         """Toggle the pinned flag on an artifact. Returns the updated entry or None."""
         with self._with_index_lock():
-            for e in self._entries:
-                if e.id == artifact_id:
-                    e.pinned = pinned
-                    self._save_index()
-                    return e
+            e = self._entries_by_id.get(artifact_id)
+            if e is not None:
+                e.pinned = pinned
+                self._save_index()
+                return e
         return None
 
     def get_entry(self, artifact_id: str) -> ArtifactEntry | None:
         self._refresh_if_stale()
-        for e in self._entries:
-            if e.id == artifact_id:
-                return e
-        return None
+        return self._entries_by_id.get(artifact_id)
+
+    def get_entries(self, artifact_ids: list[str]) -> dict[str, ArtifactEntry]:
+        """Look up several artifacts with a single staleness check.
+
+        Per-id :meth:`get_entry` calls in a loop each pay a stat (and possible
+        index reload) in ``_refresh_if_stale``; batch callers should use this
+        instead. Returns a mapping of id → entry; missing ids are omitted.
+        """
+        self._refresh_if_stale()
+        return {aid: self._entries_by_id[aid] for aid in artifact_ids if aid in self._entries_by_id}
 
     def delete_entry(self, artifact_id: str) -> bool:
         """Delete an artifact by ID, removing both the index entry and physical file.
@@ -474,15 +487,15 @@ class ArtifactStore(BaseStore[ArtifactEntry]):
         """
         deleted: ArtifactEntry | None = None
         with self._with_index_lock():
-            for i, e in enumerate(self._entries):
-                if e.id == artifact_id:
-                    filepath = self._store_dir / e.filename
-                    if filepath.exists():
-                        filepath.unlink()
-                    deleted = e
-                    del self._entries[i]
-                    self._save_index()
-                    break
+            e = self._entries_by_id.get(artifact_id)
+            if e is not None:
+                filepath = self._store_dir / e.filename
+                if filepath.exists():
+                    filepath.unlink()
+                deleted = e
+                self._entries.remove(e)
+                del self._entries_by_id[artifact_id]
+                self._save_index()
 
         if deleted is None:
             return False
@@ -504,6 +517,7 @@ class ArtifactStore(BaseStore[ArtifactEntry]):
                 if filepath.exists():
                     filepath.unlink()
             self._entries.clear()
+            self._entries_by_id.clear()
             self._save_index()
 
         for entry in snapshot:
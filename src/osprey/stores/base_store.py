@@ -30,11 +30,20 @@ T = TypeVar("T")
 
 
 def _sanitize_for_json(obj: Any) -> Any:
-    """Replace float('nan') and float('inf') with None, recursively."""
+    """Replace float('nan') and float('inf') with None, recursively.
+
+    Containers with nothing to replace — the common case for an index save —
+    are returned as-is rather than rebuilt, so sanitizing is a read-only walk
+    unless a non-finite float is actually present.
+    """
     if isinstance(obj, dict):
-        return {k: _sanitize_for_json(v) for k, v in obj.items()}
+        if any(_sanitize_for_json(v) is not v for v in obj.values()):
+            return {k: _sanitize_for_json(v) for k, v in obj.items()}
+        return obj
     if isinstance(obj, list):
-        return [_sanitize_for_json(v) for v in obj]
+        if any(_sanitize_for_json(v) is not v for v in obj):
+            return [_sanitize_for_json(v) for v in obj]
+        return obj
     if isinstance(obj, float) and (obj != obj or obj == float("inf") or obj == float("-inf")):
         return None
     return obj
@@ -76,12 +85,19 @@ class BaseStore(Generic[T]):
         self._store_dir = self._workspace / self._subdir if self._subdir else self._workspace
         self._index_file = self._store_dir / self._index_filename
         self._entries: list[T] = []
+        # id → entry lookup kept in sync with ``_entries`` so point lookups
+        # (get/update/delete by id) don't scan the whole list.
+        self._entries_by_id: dict[str, T] = {}
         self._index_mtime: float = 0.0
         # In-process reentrant lock guarding ``_entries`` reads/rebinds and
         # saves. The file ``flock`` only serializes across processes; this lock
         # prevents a background reload (e.g. StoreIndexWatcher) from swapping
         # ``_entries`` out from under a same-process mutation.
         self._thread_lock = threading.RLock()
+        # Reentrancy / batching state — guarded by ``_thread_lock``.
+        self._index_lock_depth = 0
+        self._defer_depth = 0
+        self._save_deferred = False
         self._load_index()
 
     def _entry_from_dict(self, d: dict) -> T:
@@ -106,19 +122,58 @@ class BaseStore(Generic[T]):
         All mutating operations (save, delete, update) should wrap their
         critical section under this lock to prevent cross-process TOCTOU
         races on the shared index file.
+
+        Reentrant within a thread: ``flock`` on a second fd for the same file
+        would block against our own outer lock, so nested acquisitions (e.g.
+        a mutation inside :meth:`defer_saves`) reuse the outer lock instead of
+        re-locking and re-loading.
         """
         self._ensure_dirs()
-        fd = open(self._lock_file, "w")
         # Hold the in-process lock across the whole critical section so a
         # concurrent reload can't rebind ``_entries`` between the caller's
         # mutation and its ``_save_index()``.
         with self._thread_lock:
+            if self._index_lock_depth > 0:
+                # Already locked by this thread — index was reloaded when the
+                # outer lock was taken.
+                self._index_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._index_lock_depth -= 1
+                return
+            # Raw fd rather than a buffered file object — the lock file never
+            # carries content, so the wrapper only adds allocation and a
+            # GC-dependent close.
+            fd = os.open(self._lock_file, os.O_WRONLY | os.O_CREAT, 0o644)
             try:
-                fcntl.flock(fd.fileno(), fcntl.LOCK_EX)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                self._index_lock_depth += 1
                 self._load_index()  # Always reload under lock
                 yield
             finally:
-                fd.close()  # Releases lock
+                self._index_lock_depth -= 1
+                os.close(fd)  # Releases lock
+
+    @contextmanager
+    def defer_saves(self):
+        """Coalesce ``_save_index()`` calls within the block into one write.
+
+        Holds the index lock for the duration and rewrites the index once on
+        exit (if any mutation requested a save), so a burst of mutations —
+        e.g. registering several figures from a single execution — pays one
+        serialize-and-replace instead of one per entry. Nestable; only the
+        outermost block writes.
+        """
+        with self._with_index_lock():
+            self._defer_depth += 1
+            try:
+                yield
+            finally:
+                self._defer_depth -= 1
+                if self._defer_depth == 0 and self._save_deferred:
+                    self._save_deferred = False
+                    self._save_index()
 
     def _load_index(self) -> None:
         """Load the index from disk, if present."""
@@ -129,10 +184,12 @@ class BaseStore(Generic[T]):
                     with open(self._index_file) as f:
                         data = json.load(f)
                     self._entries = self._parse_index_data(data)
+                    self._entries_by_id = {e.id: e for e in self._entries}
                     self._post_load_index()
                 except Exception:
                     logger.warning("Could not load %s index; starting fresh", self._store_name)
                     self._entries = []
+                    self._entries_by_id = {}
                     self._post_load_index()
 
     def _parse_index_data(self, data: Any) -> list[T]:
@@ -169,8 +226,14 @@ class BaseStore(Generic[T]):
         ``open(path, "w")`` left a window where a reader saw an empty/partial
         file and logged "Could not load ... index; starting fresh", blanking the
         gallery until the next refresh.
+
+        Inside a :meth:`defer_saves` block the write is recorded and performed
+        once when the outermost block exits.
         """
         with self._thread_lock:
+            if self._defer_depth > 0:
+                self._save_deferred = True
+                return
             self._ensure_dirs()
             index_data = self._build_index_data()
             payload = _sanitize_for_json(index_data)
@@ -248,12 +311,12 @@ class BaseStore(Generic[T]):
             store.update_entry_metadata(entry.id, category="document", source_agent="data-visualizer")
         """
         with self._with_index_lock():
-            for e in self._entries:
-                if e.id == entry_id:
-                    for key, value in kwargs.items():
-                        if not hasattr(e, key):
-                            raise AttributeError(f"{type(e).__name__} has no attribute {key!r}")
-                        setattr(e, key, value)
-                    self._save_index()
-                    return e
+            e = self._entries_by_id.get(entry_id)
+            if e is not None:
+                for key, value in kwargs.items():
+                    if not hasattr(e, key):
+                        raise AttributeError(f"{type(e).__name__} has no attribute {key!r}")
+                    setattr(e, key, value)
+                self._save_index()
+                return e
         return None
@@ -49,22 +49,59 @@ def get_project_dir(hook_input):
 _osprey_config_cache = None
 
 
+def _read_config_file(config_path):
+    """Parse config.yml, preferring its JSON sidecar mirror when fresh.
+
+    The sidecar (``config.cache.json``, refreshed whenever config.yml is
+    newer) lets hook processes json.load instead of importing yaml and
+    paying the pure-Python parse. The YAML stays authoritative.
+    """
+    cache_path = config_path.with_suffix(".cache.json")
+    try:
+        if cache_path.stat().st_mtime >= config_path.stat().st_mtime:
+            with open(cache_path) as f:
+                return json.load(f) or {}
+    except (OSError, json.JSONDecodeError, ValueError):
+        pass  # Stale/missing/corrupt cache — reparse the YAML below
+    import yaml
+
+    with open(config_path) as f:
+        cfg = yaml.safe_load(f) or {}
+    try:
+        # Only cache configs that survive a lossless JSON round-trip.
+        # Serializing with default=str would silently stringify YAML-native
+        # values (dates/timestamps), so a cache hit would return different
+        # types than a fresh yaml.safe_load; such configs skip the sidecar.
+        payload = json.dumps(cfg)
+        if json.loads(payload) != cfg:
+            return cfg
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass  # Cache write is best-effort; never break a hook
+    return cfg
+
+
 def load_osprey_config(hook_input=None):
-    """Load project config.yml with caching. Falls back to {} on any failure."""
+    """Load project config.yml with caching. Falls back to {} on any failure.
+
+    Hooks run as a fresh process per tool event, so the module-level cache
+    only lives for one invocation; :func:`_read_config_file`'s JSON sidecar
+    carries the parse across invocations.
+    """
     global _osprey_config_cache
     if _osprey_config_cache is not None:
         return _osprey_config_cache
     try:
-        import yaml
-
         project_dir = get_project_dir(hook_input) if hook_input else ""
         default = (
             str(Path(project_dir) / "config.yml") if project_dir else str(Path.cwd() / "config.yml")
         )
         config_path = Path(os.path.expandvars(os.environ.get("OSPREY_CONFIG", default)))
         if config_path.exists():
-            with open(config_path) as f:
-                _osprey_config_cache = yaml.safe_load(f) or {}
+            _osprey_config_cache = _read_config_file(config_path)
         else:
             _osprey_config_cache = {}
     except Exception:
@@ -79,7 +116,9 @@ def _is_debug_enabled(hook_input):
     """Check whether hook debug logging is enabled.
 
     Fast path: ``OSPREY_HOOK_DEBUG`` env var.
-    Fallback: read ``hooks.debug`` from ``config.yml`` (cached after first read).
+    Fallback: read ``hooks.debug`` from ``config.yml`` (cached after first
+    read, served from the JSON sidecar when fresh rather than re-parsing
+    the whole YAML for a one-key lookup).
     """
     if os.environ.get("OSPREY_HOOK_DEBUG"):
         return True
@@ -93,15 +132,10 @@ def _is_debug_enabled(hook_input):
     if not project_dir:
         return False
     try:
-        from pathlib import Path
-
-        import yaml
-
         default = str(Path(project_dir) / "config.yml")
         config_path = Path(os.path.expandvars(os.environ.get("OSPREY_CONFIG", default)))
         if config_path.exists():
-            with open(config_path) as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = _read_config_file(config_path)
             _debug_from_config = bool(cfg.get("hooks", {}).get("debug"))
     except Exception:
         pass  # never break a hook for logging
@@ -42,24 +42,43 @@ def _context(data: dict) -> tuple[int, int, int]:
     return pct, used_k, max_k
 
 
+def _git_branch(cwd_full: str) -> str:
+    """Read the current branch straight from ``.git/HEAD``.
+
+    The statusline runs on every render, so forking ``git rev-parse`` each
+    time is the dominant cost of the whole script; the ref is a one-line
+    file read. Handles ``.git`` pointer files (worktrees/submodules) and
+    mirrors ``rev-parse --abbrev-ref`` by returning "HEAD" when detached.
+    """
+    try:
+        directory = Path(cwd_full).resolve()
+        for parent in (directory, *directory.parents):
+            git = parent / ".git"
+            if git.is_dir():
+                head = git / "HEAD"
+            elif git.is_file():
+                pointer = git.read_text(encoding="utf-8").strip()
+                if not pointer.startswith("gitdir:"):
+                    return ""
+                gitdir = Path(pointer[len("gitdir:") :].strip())
+                if not gitdir.is_absolute():
+                    gitdir = parent / gitdir
+                head = gitdir / "HEAD"
+            else:
+                continue
+            content = head.read_text(encoding="utf-8").strip()
+            if content.startswith("ref: "):
+                return content[5:].removeprefix("refs/heads/")
+            return "HEAD"
+    except (OSError, UnicodeError):
+        pass  # Unreadable or corrupt HEAD/pointer file — no branch segment
+    return ""
+
+
 def _dir_and_branch(data: dict) -> tuple[str, str]:
     cwd_full = (data.get("workspace") or {}).get("current_dir") or ""
     cwd = Path(cwd_full).name or cwd_full
-    branch = ""
-    if cwd_full:
-        import subprocess
-
-        try:
-            r = subprocess.run(
-                ["git", "-C", cwd_full, "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=1,
-            )
-            if r.returncode == 0:
-                branch = r.stdout.strip()
-        except Exception:
-            pass
+    branch = _git_branch(cwd_full) if cwd_full else ""
     return cwd, branch
 
 
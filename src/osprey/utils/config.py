@@ -22,6 +22,10 @@ if TYPE_CHECKING:
 # The short name 'CONFIG' enables easy filtering: quiet_logger(['registry', 'CONFIG'])
 logger = logging.getLogger("CONFIG")
 
+# Prefer the libyaml-backed C loader (roughly 10x faster than the pure-Python
+# one on a full config.yml); fall back when PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def resolve_env_vars(data: Any, *, environ: "Mapping[str, str] | None" = None) -> Any:
     """Recursively resolve environment variables in configuration data.
@@ -204,7 +208,7 @@ class ConfigBuilder:
         """Load and validate a YAML configuration file."""
         try:
             with open(file_path) as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
 
             if config is None:
                 logger.warning(f"Configuration file is empty: {file_path}")
@@ -237,8 +241,6 @@ class ConfigBuilder:
             - expanded_config: Config with ${VAR} placeholders resolved to actual values
             - unexpanded_config: Config with ${VAR} placeholders preserved (for deployment)
         """
-        import copy
-
         config = self._load_yaml_file(self.config_path)
 
         unexpanded_config = copy.deepcopy(config)
@@ -384,7 +386,8 @@ class ConfigBuilder:
         """Get the current/primary application name."""
         applications = self.get("applications", [])
         if isinstance(applications, dict) and applications:
-            return list(applications.keys())[0]
+            # First key without materializing the whole key list
+            return next(iter(applications))
         elif isinstance(applications, list) and applications:
             return applications[0]
         return None
@@ -706,6 +709,14 @@ def get_facility_timezone() -> "ZoneInfo":
     from zoneinfo import ZoneInfo
 
     try:
+        # This runs on every timestamp render (several times per entry in the
+        # ARIEL responses), so the resolved zone is cached on the active
+        # ConfigBuilder rather than re-walking the config per call — resetting
+        # or replacing the singleton naturally invalidates the cache.
+        config = _get_config()
+        cached = getattr(config, "_facility_tz", None)
+        if cached is not None:
+            return cached
         tz_name = get_config_value("facility_timezone", "UTC")
         zone = ZoneInfo(tz_name)
     except Exception as exc:  # noqa: BLE001 - any failure must degrade to UTC, not raise
@@ -713,6 +724,7 @@ def get_facility_timezone() -> "ZoneInfo":
         return ZoneInfo("UTC")
 
     _warn_on_tz_drift(tz_name)
+    config._facility_tz = zone
     return zone
 
 
@@ -24,7 +24,9 @@ Typical usage:
 
 from __future__ import annotations
 
+import io
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -51,9 +53,37 @@ def _load(path: Path) -> Any:
 
 
 def _save(path: Path, data: Any) -> None:
-    """Write data back to a YAML file, preserving comments."""
-    with open(path, "w", encoding="utf-8") as f:
-        _yaml.dump(data, f)
+    """Write data back to a YAML file, preserving comments.
+
+    Serializes to memory first and skips the disk write when the output is
+    byte-identical to the current file, so no-op updates leave the mtime
+    untouched and mtime-based watchers and drift checks don't fire spuriously.
+
+    Real changes go through a temp file and ``os.replace`` with one fsync:
+    writing config.yml in place truncates first, so a crash mid-write would
+    leave the user with a corrupt config.
+    """
+    buf = io.StringIO()
+    _yaml.dump(data, buf)
+    encoded = buf.getvalue().encode("utf-8")
+    try:
+        if path.exists() and path.read_bytes() == encoded:
+            return
+    except OSError:
+        pass  # Unreadable existing file — fall through to the write
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        # Binary mode + a pre-encoded payload makes this a single write()
+        # rather than the many small writes ruamel emits when dumping
+        # straight to a file object.
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 # =============================================================================
@@ -80,15 +110,9 @@ def config_add_to_list(
 
     node = data
     for key in key_path[:-1]:
-        if key not in node:
-            node[key] = {}
-        node = node[key]
+        node = node.setdefault(key, {})
 
-    leaf = key_path[-1]
-    if leaf not in node:
-        node[leaf] = []
-
-    lst = node[leaf]
+    lst = node.setdefault(key_path[-1], [])
     if value in lst:
         return False
 
@@ -173,9 +197,7 @@ def config_update_fields(
         parts = dotted_key.split(".")
         node = data
         for part in parts[:-1]:
-            if part not in node:
-                node[part] = {}
-            node = node[part]
+            node = node.setdefault(part, {})
         node[parts[-1]] = value
 
     _save(config_path, data)
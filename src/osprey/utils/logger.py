@@ -146,12 +146,23 @@ class ComponentLogger:
         return self.base_logger.isEnabledFor(level)
 
 
+# True once the root RichHandler is installed. get_logger() calls this on
+# every invocation, so without the flag each call rescans the root logger's
+# handler list just to conclude there is nothing to do.
+_rich_configured = False
+
+
 def _setup_rich_logging(level: int = logging.INFO) -> None:
     """Configure Rich logging for the root logger (called once)."""
+    global _rich_configured
+    if _rich_configured:
+        return
+
     root_logger = logging.getLogger()
 
     for handler in root_logger.handlers:
         if isinstance(handler, RichHandler):
+            _rich_configured = True
             return
 
     if root_logger.hasHandlers():
@@ -201,6 +212,15 @@ def _setup_rich_logging(level: int = logging.INFO) -> None:
     for lib in ["httpx", "httpcore", "requests", "urllib3", "LiteLLM", "claude_agent_sdk"]:
         logging.getLogger(lib).setLevel(logging.WARNING)
 
+    _rich_configured = True
+
+
+# Cache of ComponentLogger instances keyed by component name. Building one is
+# cheap, but the per-call color lookup walks the config dict; modules call
+# get_logger() at import time and hot paths re-request the same component, so
+# resolving each component's color once is enough.
+_logger_cache: dict[str, ComponentLogger] = {}
+
 
 def get_logger(
     component_name: str = None,
@@ -248,6 +268,13 @@ def get_logger(
             "get_logger(name='custom_name', color='blue')"
         )
 
+    # Stateless loggers are reusable; only bypass the cache when a caller
+    # attaches per-call state.
+    if state is None:
+        cached = _logger_cache.get(component_name)
+        if cached is not None:
+            return cached
+
     base_logger = logging.getLogger(component_name)
 
     try:
@@ -267,4 +294,7 @@ def get_logger(
                 f"WARNING: Failed to load color config for {component_name}: {e}. Using white as fallback."
             )
 
-    return ComponentLogger(base_logger, component_name, color, state=state)
+    component_logger = ComponentLogger(base_logger, component_name, color, state=state)
+    if state is None:
+        _logger_cache[component_name] = component_logger
+    return component_logger
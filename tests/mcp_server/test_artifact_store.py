@@ -173,6 +173,18 @@ class TestArtifactStore:
 
         assert store.get_entry("nonexistent") is None
 
+    def test_get_entries_batch(self, tmp_path):
+        from osprey.stores.artifact_store import ArtifactStore
+
+        store = ArtifactStore(workspace_root=tmp_path)
+        e1 = store.save_object("a", title="One")
+        e2 = store.save_object("b", title="Two")
+
+        found = store.get_entries([e1.id, "nonexistent", e2.id])
+        assert set(found) == {e1.id, e2.id}
+        assert found[e1.id].title == "One"
+        assert found[e2.id].title == "Two"
+
     def test_index_persistence(self, tmp_path):
         """Index survives re-instantiation."""
         from osprey.stores.artifact_store import ArtifactStore
@@ -387,6 +399,50 @@ class TestUpdateEntryMetadata:
             store.update_entry_metadata(entry.id, bogus_field="oops")
 
 
+class TestDeferSaves:
+    """Tests for BaseStore.defer_saves() write coalescing."""
+
+    def test_burst_of_saves_writes_index_once(self, tmp_path):
+        from osprey.stores import base_store
+        from osprey.stores.artifact_store import ArtifactStore
+
+        store = ArtifactStore(workspace_root=tmp_path)
+        real_replace = base_store.os.replace
+        with patch.object(base_store.os, "replace", side_effect=real_replace) as spy:
+            with store.defer_saves():
+                for i in range(3):
+                    store.save_file(
+                        file_content=b"data",
+                        filename=f"fig{i}.txt",
+                        artifact_type="text",
+                        title=f"Figure {i}",
+                    )
+        # One atomic index replace for the whole burst, not one per save
+        assert spy.call_count == 1
+
+    def test_entries_persisted_after_block(self, tmp_path):
+        from osprey.stores.artifact_store import ArtifactStore
+
+        store = ArtifactStore(workspace_root=tmp_path)
+        with store.defer_saves():
+            ids = [store.save_object(f"# Doc {i}", title=f"Doc {i}").id for i in range(3)]
+
+        # A fresh store instance sees everything from the coalesced write
+        store2 = ArtifactStore(workspace_root=tmp_path)
+        for art_id in ids:
+            assert store2.get_entry(art_id) is not None
+
+    def test_no_deferral_outside_block(self, tmp_path):
+        from osprey.stores.artifact_store import ArtifactStore
+
+        store = ArtifactStore(workspace_root=tmp_path)
+        entry = store.save_object("# Hello", title="Plain save")
+
+        index_file = tmp_path / "artifacts" / "artifacts.json"
+        index = json.loads(index_file.read_text())
+        assert index["entries"][0]["id"] == entry.id
+
+
 class TestCrossProcessSafety:
     """Tests for cross-process file-locking in ArtifactStore."""
 
@@ -1282,6 +1282,55 @@ class TestGenericJSONAdapterWrite:
 
         assert data["entries"][0]["books"] == ["Operations"]
 
+    @pytest.mark.asyncio
+    async def test_create_entry_appends_to_jsonl_file(self, tmp_path):
+        """create_entry on a .jsonl source appends a line without rewriting."""
+        from osprey.services.ariel_search.models import FacilityEntryCreateRequest
+
+        jsonl_file = tmp_path / "entries.jsonl"
+        existing_line = '{"id": "old-1", "timestamp": "2026-01-01T00:00:00+00:00", "text": "old"}\n'
+        jsonl_file.write_text(existing_line)
+
+        config = self._make_config(str(jsonl_file))
+        adapter = GenericJSONAdapter(config)
+
+        request = FacilityEntryCreateRequest(
+            subject="New entry",
+            details="New details",
+            author="tester",
+        )
+
+        entry_id = await adapter.create_entry(request)
+
+        content = jsonl_file.read_text()
+        # Prior content is untouched byte-for-byte (true append, no rewrite)
+        assert content.startswith(existing_line)
+
+        import json
+
+        lines = [json.loads(line) for line in content.splitlines() if line.strip()]
+        assert len(lines) == 2
+        assert lines[1]["id"] == entry_id
+        assert lines[1]["title"] == "New entry"
+
+    @pytest.mark.asyncio
+    async def test_fetch_entries_reads_jsonl_source(self, tmp_path):
+        """fetch_entries parses one entry per line from a .jsonl source."""
+        jsonl_file = tmp_path / "entries.jsonl"
+        jsonl_file.write_text(
+            '{"id": "e1", "timestamp": "2026-01-01T00:00:00+00:00", "text": "first"}\n'
+            "\n"
+            '{"id": "e2", "timestamp": "2026-01-02T00:00:00+00:00", "text": "second"}\n'
+        )
+
+        config = self._make_config(str(jsonl_file))
+        adapter = GenericJSONAdapter(config)
+
+        entries = [e async for e in adapter.fetch_entries()]
+
+        assert [e["entry_id"] for e in entries] == ["e1", "e2"]
+        assert entries[1]["raw_text"] == "second"
+
 
 class TestALSLogbookAdapterWrite:
     """Tests for ALS adapter write support."""
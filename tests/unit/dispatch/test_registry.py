@@ -263,3 +263,20 @@ async def test_history_deque_capped_at_history_max():
     # Verify the cap is configured on the deque rather than overflowing it
     # (default _HISTORY_MAX is large).
     assert reg._history["capped"].maxlen == _HISTORY_MAX
+
+
+@pytest.mark.asyncio
+async def test_get_all_history_matches_per_trigger_get_history():
+    """get_all_history returns the same filtered slices as per-trigger get_history calls."""
+    reg = TriggerRegistry()
+    await reg.register(_make_trigger("alpha"))
+    await reg.register(_make_trigger("beta"))
+    for i in range(4):
+        await reg.record_event("alpha", {"n": i}, "ok")
+    await reg.record_event("beta", {"n": 0}, "ok")
+
+    combined = await reg.get_all_history(limit=3)
+
+    assert set(combined) == {"alpha", "beta"}
+    assert combined["alpha"] == await reg.get_history("alpha", limit=3)
+    assert combined["beta"] == await reg.get_history("beta", limit=3)